@@ -23,6 +23,7 @@ from rich.panel import Panel
 from datetime import datetime
 
 from tool_manager import ToolManager
+from ppxai.client import invalidate_session_list_cache
 from ppxai.config import EXPORTS_DIR, SESSIONS_DIR
 
 console = Console()
@@ -1174,6 +1175,7 @@ class PerplexityClientPromptTools:
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(session_data, f, indent=2)
 
+        invalidate_session_list_cache()
         return filepath
 
     def chat(self, message: str, model: str, stream: bool = True):
@@ -25,6 +25,7 @@ from .config import (
     get_provider_capabilities,
     set_active_provider,
     reload_config,
+    refresh_api_keys,
     validate_config,
 )
 from .client import AIClient, PerplexityClient
@@ -66,6 +67,7 @@ __all__ = [
     "get_provider_capabilities",
     "set_active_provider",
     "reload_config",
+    "refresh_api_keys",
     "validate_config",
     # Client
     "AIClient",
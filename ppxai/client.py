@@ -6,6 +6,7 @@ import json
 import os
 import httpx
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -19,11 +20,13 @@ from .config import (
     USAGE_FILE,
     MODEL_PRICING,
     MODEL_PROVIDER,
+    cached_getenv,
     get_provider_config,
     get_active_pricing,
     get_provider_capabilities,
 )
 from .engine.context import ContextInjector
+from .engine.session import INDEX_FILENAME
 
 # Initialize Rich console
 console = Console()
@@ -50,7 +53,7 @@ class AIClient:
         """
         # Check if SSL verification should be disabled
         # Use SSL_VERIFY environment variable (applies to all HTTPS connections)
-        ssl_verify = os.getenv("SSL_VERIFY", "true").lower() != "false"
+        ssl_verify = cached_getenv("SSL_VERIFY", "true").lower() != "false"
 
         if not ssl_verify:
             # Create custom httpx client with SSL verification disabled
@@ -360,6 +363,8 @@ class AIClient:
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(session_data, f, indent=2)
 
+        # Overwriting an existing session does not touch the directory mtime
+        invalidate_session_list_cache()
         return filepath
 
     @staticmethod
@@ -392,22 +397,47 @@ class AIClient:
 
     @staticmethod
     def list_sessions() -> List[Dict]:
-        """List all saved sessions."""
-        sessions = []
-        for filepath in SESSIONS_DIR.glob("*.json"):
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    sessions.append({
-                        "name": data.get("session_name", filepath.stem),
-                        "created_at": data.get("metadata", {}).get("created_at", "Unknown"),
-                        "saved_at": data.get("saved_at", "Unknown"),
-                        "message_count": len(data.get("conversation_history", []))
-                    })
-            except Exception:
-                continue
-
-        return sorted(sessions, key=lambda x: x.get("saved_at", ""), reverse=True)
+        """List all saved sessions.
+
+        The listing is reused while the sessions directory is unchanged, so
+        back-to-back /sessions and /load calls parse the files only once.
+        """
+        try:
+            mtime_ns = SESSIONS_DIR.stat().st_mtime_ns
+        except OSError:
+            return []
+        return [dict(s) for s in _scan_sessions(SESSIONS_DIR, mtime_ns)]
+
+
+@lru_cache(maxsize=1)
+def _scan_sessions(sessions_dir: Path, mtime_ns: int) -> tuple:
+    """Read session summaries from disk, newest first.
+
+    ``mtime_ns`` is only part of the cache key: adding or removing a session
+    file changes the directory mtime and forces a rescan.
+    """
+    sessions = []
+    for filepath in sessions_dir.glob("*.json"):
+        if filepath.name == INDEX_FILENAME:
+            continue  # the engine's session index, not a session
+        try:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+                sessions.append({
+                    "name": data.get("session_name", filepath.stem),
+                    "created_at": data.get("metadata", {}).get("created_at", "Unknown"),
+                    "saved_at": data.get("saved_at", "Unknown"),
+                    "message_count": len(data.get("conversation_history", []))
+                })
+        except Exception:
+            continue
+
+    return tuple(sorted(sessions, key=lambda x: x.get("saved_at", ""), reverse=True))
+
+
+def invalidate_session_list_cache() -> None:
+    """Drop the cached session listing (call after writing a session file)."""
+    _scan_sessions.cache_clear()
 
 
 # Backward compatibility alias
@@ -3,11 +3,20 @@ Command handlers for the ppxai application.
 """
 
 import os
+import re
+import stat
+import time
 import asyncio
-from typing import Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Optional
 
 from rich.console import Console
+from rich.syntax import Syntax
 
+from .client import AIClient
 from .config import CODING_MODEL, get_coding_model, get_provider_config, get_api_key, get_base_url, PROVIDERS
 from .prompts import CODING_PROMPTS
 from .utils import read_file_content
@@ -23,8 +32,37 @@ from .ui import (
     display_tools_table,
 )
 
-if TYPE_CHECKING:
-    from .client import AIClient
+# @file references in messages (word characters, dots, hyphens, slashes)
+_REF_RE = re.compile(r'@([\w.\-/]+)')
+
+# Glob metacharacters; queries containing them are expanded with Path.glob
+_GLOB_CHARS_RE = re.compile(r'[*?\[]')
+
+# Largest file (in bytes) that an @ref will attach to a prompt
+MAX_REF_BYTES = 256 * 1024
+
+# Referenced files are read in parallel once a message names at least this many
+PARALLEL_READ_MIN_REFS = 3
+PARALLEL_READ_WORKERS = 8
+
+# Files larger than this are previewed by /show instead of highlighted in full
+SHOW_MAX_FULL_BYTES = 5 * 1024 * 1024
+SHOW_PREVIEW_LINES = 500
+
+# Directories never searched when resolving @file references
+_IGNORE_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv', '.tox', 'dist', 'build', '.eggs'})
+
+# Syntax highlighting lexer for /show, by file extension
+_EXT_TO_LANG = {
+    '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
+    '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml',
+    '.md': 'markdown', '.html': 'html', '.css': 'css',
+    '.sh': 'bash', '.bash': 'bash', '.zsh': 'bash',
+    '.rs': 'rust', '.go': 'go', '.java': 'java',
+    '.c': 'c', '.cpp': 'cpp', '.h': 'c', '.hpp': 'cpp',
+    '.rb': 'ruby', '.php': 'php', '.sql': 'sql',
+    '.xml': 'xml', '.toml': 'toml', '.ini': 'ini',
+}
 
 
 def send_coding_task(client: 'AIClient', task_type: str, user_message: str, model: str, provider: str = None) -> Optional[str]:
@@ -47,30 +85,191 @@ def send_coding_task(client: 'AIClient', task_type: str, user_message: str, mode
     return client.chat(full_message, model, stream=True)
 
 
+def _iter_files(root: str, ignore_dirs):
+    """Yield (entry, relative_path) for every file below root.
+
+    Uses an explicit os.scandir stack so ignored directories are pruned before
+    they are descended into, and dirent types avoid an extra stat() per entry.
+    Directory symlinks are not followed.
+    """
+    stack = [(root, '')]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignore_dirs:
+                            stack.append((entry.path, rel_prefix + entry.name + os.sep))
+                    elif entry.is_file():
+                        yield entry, rel_prefix + entry.name
+        except OSError:
+            # Unreadable directory (permissions, removed mid-walk) - skip it
+            continue
+
+
+def _stat_file(path) -> Optional[os.stat_result]:
+    """Return the stat result for path if it is a regular file, else None (one syscall)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+@lru_cache(maxsize=32)
+def _read_text_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read and decode a UTF-8 file, memoized on (path, mtime, size).
+
+    The stat fields in the key make a changed file miss the cache, so an
+    @reference followed by /show of the same file decodes it only once.
+    Raises UnicodeDecodeError for non-UTF-8 content (errors are not cached).
+    """
+    with open(path_str, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def _read_text(path, st: os.stat_result) -> str:
+    """Decode path as UTF-8, going through the cache for reference-sized files."""
+    if st.st_size <= MAX_REF_BYTES:
+        return _read_text_cached(str(path), st.st_mtime_ns, st.st_size)
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _count_lines(path) -> int:
+    """Count lines like content.count(newline) + 1, reading with a fixed 64 KB buffer."""
+    with open(path, 'rb') as f:
+        return sum(buf.count(b'\n') for buf in iter(lambda: f.read(1 << 16), b'')) + 1
+
+
+def _read_head(path, max_lines: int) -> str:
+    """Decode only the first max_lines lines of a UTF-8 file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return ''.join(islice(f, max_lines))
+
+
+def _read_reference(path: Path) -> Optional[str]:
+    """Read a referenced file for prompt context, or None if it should be skipped.
+
+    Special and oversized files are skipped; undecodable bytes are replaced.
+    """
+    try:
+        # One stat() both bounds the read and rejects special files
+        st = path.stat()
+        if not stat.S_ISREG(st.st_mode) or st.st_size > MAX_REF_BYTES:
+            return None
+        try:
+            return _read_text(path, st)
+        except UnicodeDecodeError:
+            return path.read_bytes().decode('utf-8', errors='replace')
+    except OSError:
+        return None
+
+
+def _match_score(path: Path, query_lower: str) -> tuple:
+    """Relevance key for a search match (exact filename, then partial, then shorter paths)."""
+    name = path.name.lower()
+    if query_lower == name:
+        return (0, len(str(path)))
+    if query_lower in name:
+        return (1, len(str(path)))
+    return (2, len(str(path)))
+
+
 class CommandHandler:
     """Handles all slash commands for the application."""
 
+    # Slash command -> handler method name; every handler takes the argument string
+    _COMMANDS = {
+        "/quit": "handle_quit",
+        "/exit": "handle_quit",
+        "/save": "handle_save",
+        "/sessions": "handle_sessions",
+        "/load": "handle_load",
+        "/usage": "handle_usage",
+        "/clear": "handle_clear",
+        "/model": "handle_model",
+        "/provider": "handle_provider",
+        "/help": "handle_help",
+        "/generate": "handle_generate",
+        "/test": "handle_test",
+        "/docs": "handle_docs",
+        "/implement": "handle_implement",
+        "/debug": "handle_debug",
+        "/explain": "handle_explain",
+        "/convert": "handle_convert",
+        "/autoroute": "handle_autoroute",
+        "/spec": "handle_spec",
+        "/tools": "handle_tools",
+        "/show": "handle_show",
+        "/cat": "handle_show",  # Alias for /show
+    }
+
+    # /tools subcommand -> (handler method name, whether it takes the remaining words)
+    _TOOLS_SUBCOMMANDS = {
+        "enable": ("_enable_tools", False),
+        "disable": ("_disable_tools", False),
+        "list": ("_list_tools", False),
+        "status": ("_tools_status", False),
+        "config": ("_tools_config", True),
+    }
+
     def __init__(self, client, api_key: str, current_model: str, base_url: str = None, provider: str = None):
         self.client = client
         self.api_key = api_key
         self.current_model = current_model
         self.base_url = base_url or "https://api.perplexity.ai"
         self.provider = provider or "perplexity"
-        self.tools_available = False
+
+        # Tool support is imported on first use (see _load_tool_support);
+        # None means the import has not been attempted yet.
+        self.tools_available: Optional[bool] = None
         self.PerplexityClientPromptTools = None
         self.load_tool_config = None
 
-        # Try to load tool support
-        try:
-            from perplexity_tools_prompt_based import PerplexityClientPromptTools
-            from tool_manager import load_tool_config
-            self.tools_available = True
-            self.PerplexityClientPromptTools = PerplexityClientPromptTools
-            self.load_tool_config = load_tool_config
-        except ImportError:
-            pass
-
-    def handle_quit(self) -> bool:
+        # Candidates from the last ambiguous /show, selectable as /show <number>
+        self._last_show_matches: list = []
+
+        # Bound handlers, built once so dispatch is a single dict lookup
+        self._dispatch = {command: getattr(self, name) for command, name in self._COMMANDS.items()}
+
+        # Event loop shared by tool init, tool chats and cleanup (created lazily)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def run_async(self, coro):
+        """Run a coroutine on the handler's persistent event loop.
+
+        Tool clients hold async HTTP clients and MCP tasks bound to the loop
+        they were initialized on, so every tool coroutine must run on the
+        same loop rather than a fresh one per asyncio.run() call.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close_loop(self):
+        """Close the persistent event loop, if one was created."""
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            finally:
+                self._loop.close()
+        self._loop = None
+
+    def _load_tool_support(self) -> bool:
+        """Import the tool stack on first use. Returns True if tools are available."""
+        if self.tools_available is None:
+            try:
+                from perplexity_tools_prompt_based import PerplexityClientPromptTools
+                from tool_manager import load_tool_config
+                self.PerplexityClientPromptTools = PerplexityClientPromptTools
+                self.load_tool_config = load_tool_config
+                self.tools_available = True
+            except ImportError:
+                self.tools_available = False
+        return self.tools_available
+
+    def handle_quit(self, args: str = "") -> bool:
         """Handle /quit or /exit command. Returns True if should exit."""
         if self.client.conversation_history:
             try:
@@ -78,6 +277,7 @@ class CommandHandler:
                 console.print(f"[dim]Session saved: {self.client.session_name}[/dim]")
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not save session: {e}[/yellow]")
+        self.close_loop()
         console.print("\n[yellow]Goodbye![/yellow]")
         return True
 
@@ -90,20 +290,16 @@ class CommandHandler:
         except Exception as e:
             console.print(f"[red]Error exporting conversation: {e}[/red]\n")
 
-    def handle_sessions(self):
+    def handle_sessions(self, args: str = ""):
         """Handle /sessions command."""
-        from .client import AIClient
         sessions = AIClient.list_sessions()
         display_sessions(sessions)
 
     def handle_load(self, args: str):
         """Handle /load command."""
-        from .client import AIClient
-
         if not args:
             console.print("[red]Please specify a session name: /load <session_name>[/red]\n")
-            sessions = AIClient.list_sessions()
-            display_sessions(sessions)
+            self.handle_sessions()
             return
 
         try:
@@ -118,13 +314,13 @@ class CommandHandler:
         except Exception as e:
             console.print(f"[red]Error loading session: {e}[/red]\n")
 
-    def handle_usage(self):
+    def handle_usage(self, args: str = ""):
         """Handle /usage command."""
         usage = self.client.get_usage_summary()
         display_usage(usage)
         display_global_usage()
 
-    def handle_clear(self):
+    def handle_clear(self, args: str = ""):
         """Handle /clear command."""
         self.client.clear_history()
         console.print("\n[green]Conversation history cleared.[/green]\n")
@@ -135,7 +331,6 @@ class CommandHandler:
 
         if args == "list":
             # List available models
-            from .config import get_provider_config
             config = get_provider_config(self.provider)
             models = config.get("models", {})
 
@@ -147,7 +342,6 @@ class CommandHandler:
             console.print()
         elif args:
             # Direct model selection by ID
-            from .config import get_provider_config
             config = get_provider_config(self.provider)
             models = config.get("models", {})
 
@@ -173,8 +367,6 @@ class CommandHandler:
 
     def handle_provider(self, args: str = ""):
         """Handle /provider command - switch between providers."""
-        from .client import AIClient
-
         args = args.strip().lower()
 
         if args == "list":
@@ -205,17 +397,17 @@ class CommandHandler:
             console.print("[dim]Same provider selected, no change needed.[/dim]\n")
             return
 
+        new_config = get_provider_config(new_provider)
+
         # Check if new provider has API key configured
         new_api_key = get_api_key(new_provider)
         if not new_api_key:
-            config = get_provider_config(new_provider)
-            console.print(f"[red]Error: {config['api_key_env']} not configured.[/red]")
+            console.print(f"[red]Error: {new_config['api_key_env']} not configured.[/red]")
             console.print("[yellow]Please add the API key to your .env file.[/yellow]\n")
             return
 
         # Switch to new provider
         new_base_url = get_base_url(new_provider)
-        new_config = get_provider_config(new_provider)
 
         # Create new client with the new provider
         new_client = AIClient(new_api_key, new_base_url, provider=new_provider)
@@ -237,7 +429,7 @@ class CommandHandler:
 
         console.print(f"\n[green]Switched to:[/green] {new_config['name']} (model: {self.current_model})\n")
 
-    def handle_help(self):
+    def handle_help(self, args: str = ""):
         """Handle /help command."""
         display_welcome()
 
@@ -367,7 +559,7 @@ class CommandHandler:
 
     def handle_tools(self, args: str):
         """Handle /tools command."""
-        if not self.tools_available:
+        if not self._load_tool_support():
             console.print("[red]Error: Tool support not available.[/red]")
             console.print("[yellow]Missing dependencies. Check docs/TOOL_CREATION_GUIDE.md[/yellow]\n")
             return
@@ -376,19 +568,18 @@ class CommandHandler:
         subcommand = parts[0].lower() if parts else "status"
         subargs = parts[1:] if len(parts) > 1 else []
 
-        if subcommand == "enable":
-            self._enable_tools()
-        elif subcommand == "disable":
-            self._disable_tools()
-        elif subcommand == "list":
-            self._list_tools()
-        elif subcommand == "status":
-            self._tools_status()
-        elif subcommand == "config":
-            self._tools_config(subargs)
-        else:
+        entry = self._TOOLS_SUBCOMMANDS.get(subcommand)
+        if entry is None:
             console.print(f"[red]Unknown subcommand: {subcommand}[/red]")
             console.print("[yellow]Available: enable, disable, list, status, config[/yellow]\n")
+            return
+
+        method_name, takes_args = entry
+        method = getattr(self, method_name)
+        if takes_args:
+            method(subargs)
+        else:
+            method()
 
     def _enable_tools(self):
         """Enable AI tools."""
@@ -411,7 +602,7 @@ class CommandHandler:
 
         # Initialize tools (built-in only by default)
         console.print("[cyan]Initializing tools...[/cyan]")
-        asyncio.run(tool_client.initialize_tools(mcp_servers=[]))
+        self.run_async(tool_client.initialize_tools(mcp_servers=[]))
 
         # Replace client
         self.client = tool_client
@@ -420,8 +611,6 @@ class CommandHandler:
 
     def _disable_tools(self):
         """Disable AI tools."""
-        from .client import AIClient
-
         if not isinstance(self.client, self.PerplexityClientPromptTools):
             console.print("[yellow]Tools not enabled[/yellow]\n")
             return
@@ -433,7 +622,7 @@ class CommandHandler:
         regular_client.current_session_usage = self.client.current_session_usage
 
         # Cleanup tool client
-        asyncio.run(self.client.cleanup())
+        self.run_async(self.client.cleanup())
 
         self.client = regular_client
         console.print("[yellow]Tools disabled[/yellow]\n")
@@ -502,71 +691,99 @@ class CommandHandler:
 
     def _search_files(self, query: str, max_results: int = 10) -> list:
         """Search for files matching query in current directory."""
-        from pathlib import Path
-        import fnmatch
-
         # Remove @ prefix if present
         query = query.lstrip('@').strip()
+        return self._search_files_batch([query], max_results)[query]
+
+    def _search_files_batch(self, queries: list, max_results: int = 10) -> dict:
+        """Search for several queries with at most one directory walk.
 
+        Returns:
+            dict: {query: list of matching paths, best first}
+        """
         # Get search root (current working directory)
         root = Path.cwd()
+        return self._find_files(list(dict.fromkeys(queries)), root, max_results)
 
-        # Build search patterns
-        patterns = []
-        query_lower = query.lower()
+    def _find_files(self, queries: list, root: Path, max_results: int) -> dict:
+        """Walk root once and return {query: up to max_results matching files, best first}."""
+        results = {}
+        # Per-query state: [query, query_lower, parts, single, matches, done]
+        pending = []
 
-        # If query looks like a path, try exact match first
-        if '/' in query or '\\' in query:
+        for query in queries:
+            # Try the query as a path relative to root first: one stat() instead of
+            # a walk for the common "/show README.md" and "@docs/guide.md" cases
             direct_path = root / query
-            if direct_path.exists() and direct_path.is_file():
-                return [direct_path]
+            if query and _stat_file(direct_path) is not None:
+                results[query] = [direct_path]
+                continue
 
-        # Extract filename parts for fuzzy matching
-        parts = query_lower.replace('-', ' ').replace('_', ' ').split()
+            # Wildcard queries are expanded as globs rather than fuzzy-matched
+            if _GLOB_CHARS_RE.search(query):
+                try:
+                    files = [p for p in root.glob(query) if _stat_file(p) is not None]
+                except (NotImplementedError, ValueError):
+                    files = []  # absolute or malformed pattern
+                files.sort(key=lambda p: len(str(p)))
+                results[query] = files[:max_results]
+                continue
+
+            query_lower = query.lower()
+            # Extract filename parts for fuzzy matching; longest first, since a
+            # longer substring is the likeliest to fail and short-circuit all()
+            parts = sorted(set(query_lower.replace('-', ' ').replace('_', ' ').split()),
+                           key=len, reverse=True)
+            # A single part needs one substring test instead of an all() generator
+            single = parts[0] if len(parts) == 1 else None
+            pending.append([query, query_lower, parts, single, [], False])
+
+        active = pending
+        limit = max_results * 2  # Get more for sorting
+
+        # Walk directory tree (skip common ignore patterns)
+        walker = _iter_files(str(root), _IGNORE_DIRS) if active else ()
+        for entry, rel_path in walker:
+            # Check if filename matches
+            filename_lower = entry.name.lower()
+            path_str_lower = rel_path.lower()
+            finished = False
+
+            for state in active:
+                query, query_lower, parts, single, matches, _ = state
+
+                # Exact filename match wins outright
+                if query_lower == filename_lower:
+                    results[query] = [Path(entry.path)]
+                    state[5] = finished = True
+                    continue
+
+                # Check if all query parts are in the path. This also covers a
+                # partial filename match: the parts are substrings of the query,
+                # and the filename is part of the path.
+                if single is not None:
+                    if single not in path_str_lower:
+                        continue
+                elif not all(part in path_str_lower for part in parts):
+                    continue
+                matches.append(Path(entry.path))
 
-        matches = []
-        try:
-            # Walk directory tree (skip hidden dirs and common ignore patterns)
-            ignore_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', '.tox', 'dist', 'build', '.eggs'}
+                if len(matches) >= limit:
+                    state[5] = finished = True
 
-            for path in root.rglob('*'):
-                if path.is_file():
-                    # Skip files in ignored directories
-                    if any(ignored in path.parts for ignored in ignore_dirs):
-                        continue
+            if finished:
+                active = [state for state in active if not state[5]]
+                if not active:
+                    break
 
-                    # Check if filename matches
-                    filename_lower = path.name.lower()
-                    path_str_lower = str(path.relative_to(root)).lower()
-
-                    # Exact filename match
-                    if query_lower == filename_lower:
-                        return [path]  # Exact match, return immediately
-
-                    # Check if all query parts are in the path
-                    if all(part in path_str_lower for part in parts):
-                        matches.append(path)
-                    # Also check partial filename match
-                    elif query_lower in filename_lower:
-                        matches.append(path)
-
-                    if len(matches) >= max_results * 2:  # Get more for sorting
-                        break
-        except PermissionError:
-            pass
-
-        # Sort by relevance (shorter paths and exact filename matches first)
-        def score(p):
-            name = p.name.lower()
-            # Prefer exact filename matches
-            if query_lower == name:
-                return (0, len(str(p)))
-            if query_lower in name:
-                return (1, len(str(p)))
-            return (2, len(str(p)))
-
-        matches.sort(key=score)
-        return matches[:max_results]
+        for query, query_lower, _, _, matches, _ in pending:
+            if query in results:
+                continue
+            # Sort by relevance (shorter paths and exact filename matches first)
+            matches.sort(key=lambda p: _match_score(p, query_lower))
+            results[query] = matches[:max_results]
+
+        return results
 
     def process_file_references(self, content: str) -> tuple[str, list[dict]]:
         """
@@ -575,64 +792,60 @@ class CommandHandler:
         Returns:
             tuple: (augmented_message, list of {name, path} dicts for resolved files)
         """
-        import re
-        from pathlib import Path
-
-        # Match @filename patterns (word characters, dots, hyphens, slashes)
-        ref_pattern = r'@([\w.\-/]+)'
-        matches = list(re.finditer(ref_pattern, content))
+        matches = list(_REF_RE.finditer(content))
 
         if not matches:
             return content, []
 
-        resolved_files = []
-        processed_message = content
-
-        for match in matches:
-            ref = match.group(1)
-            full_match = match.group(0)
-
-            # Try to resolve the file
-            files = self._search_files(ref, max_results=1)
-            if files:
-                file_path = files[0]
-                try:
-                    file_content = file_path.read_text()
-                    filename = file_path.name
+        # Resolve every distinct reference with a single directory walk
+        refs = list(dict.fromkeys(match.group(1) for match in matches))
+        found = self._search_files_batch(refs, max_results=1)
 
-                    resolved_files.append({
-                        'name': filename,
-                        'path': str(file_path),
-                        'content': file_content
-                    })
+        targets = [(ref, found[ref][0]) for ref in refs if found[ref]]
+        paths = [path for _, path in targets]
+        if len(paths) >= PARALLEL_READ_MIN_REFS:
+            # Overlap the I/O latency of many files (helps most on network filesystems)
+            with ThreadPoolExecutor(max_workers=min(PARALLEL_READ_WORKERS, len(paths))) as pool:
+                contents = list(pool.map(_read_reference, paths))
+        else:
+            contents = [_read_reference(path) for path in paths]
 
-                    # Replace @ref with just the filename in the message
-                    processed_message = processed_message.replace(full_match, filename, 1)
-                except Exception:
-                    # File couldn't be read, leave reference as-is
-                    pass
+        resolved_files = []
+        replacements = {}  # ref -> filename, applied in a single pass below
+
+        for (ref, file_path), file_content in zip(targets, contents):
+            if file_content is None:
+                # File couldn't be read, leave reference as-is
+                continue
+            filename = file_path.name
+            resolved_files.append({
+                'name': filename,
+                'path': str(file_path),
+                'ext': file_path.suffix.lstrip('.'),
+                'content': file_content
+            })
+
+            # Replace @ref with just the filename in the message
+            replacements[ref] = filename
 
         if not resolved_files:
             return content, []
 
-        # Build augmented message with file contents as context
-        augmented_message = processed_message
-        augmented_message += '\n\n---\n**Referenced Files:**\n'
+        processed_message = _REF_RE.sub(lambda m: replacements.get(m.group(1), m.group(0)), content)
 
+        # Build augmented message with file contents as context
+        parts = [processed_message, '\n\n---\n**Referenced Files:**\n']
         for f in resolved_files:
-            ext = Path(f['name']).suffix.lstrip('.')
-            augmented_message += f"\n**{f['name']}** (`{f['path']}`):\n```{ext}\n{f['content']}\n```\n"
+            parts.append(f"\n**{f['name']}** (`{f['path']}`):\n```{f['ext']}\n")
+            parts.append(f['content'])
+            parts.append('\n```\n')
+        augmented_message = ''.join(parts)
 
         return augmented_message, [{'name': f['name'], 'path': f['path']} for f in resolved_files]
 
     def handle_show(self, args: str):
         """Display file contents locally without LLM call."""
-        from pathlib import Path
-        from rich.syntax import Syntax
-        import time
-
         start_time = time.time()
-
         if not args.strip():
             console.print("[red]Usage: /show <filepath> or /show @<search-query>[/red]")
             console.print("[dim]Examples:[/dim]")
@@ -644,18 +857,24 @@ class CommandHandler:
         query = args.strip()
 
         # Extract @reference if present (ignore trailing words like "file", "in docs", etc.)
-        import re
-        at_match = re.search(r'@([\w.\-/]+)', query)
+        at_match = _REF_RE.search(query)
         if at_match:
             query = at_match.group(1)  # Use just the reference without @
 
+        cwd = Path.cwd()
+
         # Check if it's a direct path first
         direct_path = Path(query).expanduser()
         if not direct_path.is_absolute():
-            direct_path = Path.cwd() / query
+            direct_path = cwd / query
 
-        if direct_path.exists() and direct_path.is_file():
+        st = _stat_file(direct_path)
+        if st is not None:
             path = direct_path.resolve()
+        elif query.isdigit() and 1 <= int(query) <= len(self._last_show_matches):
+            # Pick from the previous multiple-match listing without searching again
+            path = self._last_show_matches[int(query) - 1]
+            st = _stat_file(path)
         else:
             # Search for files
             console.print(f"[dim]Searching for '{query}'...[/dim]")
@@ -667,45 +886,49 @@ class CommandHandler:
 
             if len(matches) == 1:
                 path = matches[0]
-                console.print(f"[dim]Found: {path.relative_to(Path.cwd())}[/dim]\n")
+                console.print(f"[dim]Found: {path.relative_to(cwd)}[/dim]\n")
             else:
                 # Multiple matches - let user choose
                 console.print(f"\n[yellow]Multiple files found ({len(matches)}):[/yellow]")
                 for i, match in enumerate(matches, 1):
-                    rel_path = match.relative_to(Path.cwd())
+                    rel_path = match.relative_to(cwd)
                     console.print(f"  [cyan]{i}[/cyan]. {rel_path}")
 
-                console.print("\n[dim]Use exact path: /show <path>[/dim]\n")
+                self._last_show_matches = matches
+                console.print("\n[dim]Use /show <number> or the exact path: /show <path>[/dim]\n")
                 return
 
-        if not path.is_file():
+            st = _stat_file(path)
+
+        if st is None:
             console.print(f"[red]Not a file: {query}[/red]\n")
             return
 
         try:
-            content = path.read_text(encoding='utf-8')
-            lines = content.split('\n')
+            if st.st_size > SHOW_MAX_FULL_BYTES:
+                # Count lines with a fixed-size buffer and decode only the preview,
+                # so a huge file is never resident in full
+                line_count = _count_lines(path)
+                truncated = line_count > SHOW_PREVIEW_LINES
+                content = _read_head(path, SHOW_PREVIEW_LINES) if truncated else _read_text(path, st)
+            else:
+                content = _read_text(path, st)
+                line_count = content.count('\n') + 1
+                truncated = False
 
             # Detect language from extension
-            ext_to_lang = {
-                '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
-                '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml',
-                '.md': 'markdown', '.html': 'html', '.css': 'css',
-                '.sh': 'bash', '.bash': 'bash', '.zsh': 'bash',
-                '.rs': 'rust', '.go': 'go', '.java': 'java',
-                '.c': 'c', '.cpp': 'cpp', '.h': 'c', '.hpp': 'cpp',
-                '.rb': 'ruby', '.php': 'php', '.sql': 'sql',
-                '.xml': 'xml', '.toml': 'toml', '.ini': 'ini',
-            }
-            lang = ext_to_lang.get(path.suffix.lower(), 'text')
+            lang = _EXT_TO_LANG.get(path.suffix.lower(), 'text')
 
             # Show file info
-            size_kb = path.stat().st_size / 1024
-            console.print(f"\n[bold cyan]{path.name}[/bold cyan] [dim]({size_kb:.1f} KB, {len(lines)} lines)[/dim]\n")
+            size_kb = st.st_size / 1024
+            console.print(f"\n[bold cyan]{path.name}[/bold cyan] [dim]({size_kb:.1f} KB, {line_count} lines)[/dim]\n")
 
-            # Display with syntax highlighting (no truncation for local viewing)
+            # Display with syntax highlighting; only very large files are cut to a preview
             syntax = Syntax(content, lang, theme="monokai", line_numbers=True)
             console.print(syntax)
+            if truncated:
+                console.print(f"[yellow]Showing first {SHOW_PREVIEW_LINES} of {line_count} lines (file is larger than "
+                              f"{SHOW_MAX_FULL_BYTES // (1024 * 1024)} MB)[/yellow]")
 
             # Show timing
             elapsed = time.time() - start_time
@@ -724,54 +947,17 @@ class CommandHandler:
             - True if should exit the application
             - False/None to continue
         """
-        command_parts = user_input.split(maxsplit=1)
-        command = command_parts[0].lower()
-        args = command_parts[1] if len(command_parts) > 1 else ""
-
-        if command in ["/quit", "/exit"]:
-            return self.handle_quit()
-        elif command == "/save":
-            self.handle_save(args)
-        elif command == "/sessions":
-            self.handle_sessions()
-        elif command == "/load":
-            self.handle_load(args)
-        elif command == "/usage":
-            self.handle_usage()
-        elif command == "/clear":
-            self.handle_clear()
-        elif command == "/model":
-            self.handle_model(args)
-        elif command == "/provider":
-            self.handle_provider(args)
-        elif command == "/help":
-            self.handle_help()
-        elif command == "/generate":
-            self.handle_generate(args)
-        elif command == "/test":
-            self.handle_test(args)
-        elif command == "/docs":
-            self.handle_docs(args)
-        elif command == "/implement":
-            self.handle_implement(args)
-        elif command == "/debug":
-            self.handle_debug(args)
-        elif command == "/explain":
-            self.handle_explain(args)
-        elif command == "/convert":
-            self.handle_convert(args)
-        elif command == "/autoroute":
-            self.handle_autoroute(args)
-        elif command == "/spec":
-            self.handle_spec(args)
-        elif command == "/tools":
-            self.handle_tools(args)
-        elif command == "/show":
-            self.handle_show(args)
-        elif command == "/cat":
-            self.handle_show(args)  # Alias for /show
-        else:
+        # Split on the first run of any whitespace (tabs, newlines too)
+        command, *rest = user_input.split(None, 1)
+        args = rest[0] if rest else ""
+
+        handler = self._dispatch.get(command.lower())
+        if handler is None:
             console.print(f"[red]Unknown command: {user_input}[/red]")
             console.print("[yellow]Type /help for available commands[/yellow]\n")
+            return False
+
+        result = handler(args)
 
-        return False
+        # Only /quit and /exit return True (exit the application)
+        return result is True
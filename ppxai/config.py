@@ -14,13 +14,59 @@ Config file search order:
 
 import json
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Mapping, Tuple
 
-# Load .env file from the current working directory (standard behavior)
-# This allows users to place .env in their project root
-load_dotenv()
+# orjson (optional, "fast" extra) parses config files several times faster;
+# both parsers accept bytes and raise json.JSONDecodeError subclasses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Environment settings read through cached_getenv(); cleared by invalidate_env_cache()
+_ENV_CACHE: Dict[str, str] = {}
+
+
+def cached_getenv(name: str, default: str = "") -> str:
+    """Read an environment setting once per process.
+
+    For settings that only change between runs (MODEL_PROVIDER, SSL_VERIFY)
+    and are consulted repeatedly, e.g. every time a client is created.
+
+    Args:
+        name: Environment variable name.
+        default: Value to use (and cache) when the variable is unset.
+
+    Returns:
+        The variable's value, or default.
+    """
+    try:
+        return _ENV_CACHE[name]
+    except KeyError:
+        _ensure_dotenv_loaded()
+        return _ENV_CACHE.setdefault(name, os.environ.get(name, default))
+
+
+def invalidate_env_cache() -> None:
+    """Forget values cached by cached_getenv (used by reload_config and tests)."""
+    _ENV_CACHE.clear()
+
+
+@lru_cache(maxsize=1)
+def _ensure_dotenv_loaded() -> None:
+    """Load the .env file once, on the first read of a configurable env var.
+
+    This allows users to place .env in their project root. python-dotenv is
+    imported here rather than at module level.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Directories for data storage
 PPXAI_HOME = Path.home() / ".ppxai"
@@ -128,11 +174,32 @@ DEFAULT_CAPABILITIES = {
     "realtime_info": False,
 }
 
+# Read-only view handed out as the fallback, so callers cannot mutate the defaults
+_DEFAULT_CAPS: Mapping[str, bool] = MappingProxyType(DEFAULT_CAPABILITIES)
+
+
+def _freeze(value: Any) -> Any:
+    """Wrap a dict, and every dict nested in it, in a read-only MappingProxyType.
+
+    Args:
+        value: Value to freeze (non-dict values are returned unchanged).
+
+    Returns:
+        Read-only view of the value.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
 
 # =============================================================================
 # Configuration Loading
 # =============================================================================
 
+# (PPXAI_CONFIG_FILE, cwd) -> resolved config path; reset by reload_config()
+_config_path_cache: Dict[Tuple[Optional[str], str], Optional[Path]] = {}
+
+
 def _find_config_file() -> Optional[Path]:
     """Find the configuration file following the search order.
 
@@ -141,26 +208,33 @@ def _find_config_file() -> Optional[Path]:
     2. ./ppxai-config.json (project-specific)
     3. ~/.ppxai/ppxai-config.json (user-specific)
 
+    The result is cached per PPXAI_CONFIG_FILE value and working directory,
+    so repeated lookups make no filesystem calls; reload_config() clears it.
+
     Returns:
         Path to config file if found, None otherwise.
     """
-    # 1. Check environment variable
+    _ensure_dotenv_loaded()
     env_config = os.getenv("PPXAI_CONFIG_FILE")
-    if env_config:
-        path = Path(env_config)
-        if path.exists():
-            return path
+    key = (env_config, os.getcwd())
+    try:
+        return _config_path_cache[key]
+    except KeyError:
+        pass
 
+    found = None
+    # 1. Check environment variable
+    if env_config and Path(env_config).is_file():
+        found = Path(env_config)
     # 2. Check current directory
-    local_config = Path("./ppxai-config.json")
-    if local_config.exists():
-        return local_config
-
+    elif Path("./ppxai-config.json").is_file():
+        found = Path("./ppxai-config.json")
     # 3. Check user home directory
-    if USER_CONFIG_FILE.exists():
-        return USER_CONFIG_FILE
+    elif USER_CONFIG_FILE.is_file():
+        found = USER_CONFIG_FILE
 
-    return None
+    _config_path_cache[key] = found
+    return found
 
 
 def _load_json_config(config_path: Path) -> Dict[str, Any]:
@@ -176,9 +250,7 @@ def _load_json_config(config_path: Path) -> Dict[str, Any]:
         ValueError: If the config file is invalid.
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        return config
+        return _json_loads(Path(config_path).read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in config file {config_path}: {e}")
     except Exception as e:
@@ -217,22 +289,24 @@ def _build_legacy_custom_provider() -> Optional[Dict[str, Any]]:
         Provider config dict if legacy variables are set, None otherwise.
     """
     # Check if any legacy custom variables are set
-    endpoint = os.getenv("CUSTOM_MODEL_ENDPOINT")
+    _ensure_dotenv_loaded()
+    env = os.environ
+    endpoint = env.get("CUSTOM_MODEL_ENDPOINT")
     if not endpoint:
         return None
 
-    model_id = os.getenv("CUSTOM_MODEL_ID", "custom-model")
+    model_id = env.get("CUSTOM_MODEL_ID", "custom-model")
 
     return {
-        "name": os.getenv("CUSTOM_PROVIDER_NAME", "Custom Self-Hosted"),
+        "name": env.get("CUSTOM_PROVIDER_NAME", "Custom Self-Hosted"),
         "base_url": endpoint,
         "api_key_env": "CUSTOM_API_KEY",
         "default_model": model_id,
         "coding_model": model_id,
         "models": {
             model_id: {
-                "name": os.getenv("CUSTOM_MODEL_NAME", "Custom Model"),
-                "description": os.getenv("CUSTOM_MODEL_DESC", "Self-hosted LLM model")
+                "name": env.get("CUSTOM_MODEL_NAME", "Custom Model"),
+                "description": env.get("CUSTOM_MODEL_DESC", "Self-hosted LLM model")
             },
         },
         "pricing": {
@@ -259,19 +333,92 @@ def _convert_models_format(models: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Models in internal numbered format.
     """
-    numbered_models = {}
-    for idx, (model_id, model_info) in enumerate(models.items(), 1):
-        numbered_models[str(idx)] = {
+    return {
+        str(idx): {
             "id": model_id,
             "name": model_info.get("name", model_id),
             "description": model_info.get("description", ""),
         }
-    return numbered_models
+        for idx, (model_id, model_info) in enumerate(models.items(), 1)
+    }
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Load, validate and convert a JSON config file.
+
+    Memoized on the file's path, mtime and size, so an unchanged file is not
+    re-parsed; editing the file changes the key. The returned dict is shared
+    between callers and must be treated as read-only.
+
+    Args:
+        config_path: Path to the JSON config file.
+        mtime_ns: File modification time (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        Complete configuration dictionary (see load_config).
+    """
+    json_config = _load_json_config(Path(config_path))
+
+    # Validate and process providers
+    providers = {}
+    validation_errors = []
+
+    for provider_id, provider_config in json_config.get("providers", {}).items():
+        errors = _validate_provider_config(provider_id, provider_config)
+        if errors:
+            validation_errors.extend(errors)
+            continue
+
+        # Convert models format and ensure all fields
+        processed = {
+            "name": provider_config["name"],
+            "base_url": provider_config["base_url"],
+            "api_key_env": provider_config["api_key_env"],
+            "default_model": provider_config.get("default_model"),
+            "coding_model": provider_config.get("coding_model", provider_config.get("default_model")),
+            "models": _convert_models_format(provider_config.get("models", {})),
+            "pricing": provider_config.get("pricing", {}),
+            "capabilities": MappingProxyType({**DEFAULT_CAPABILITIES, **provider_config.get("capabilities", {})}),
+        }
+
+        # Set default_model to first model if not specified
+        if not processed["default_model"] and processed["models"]:
+            first_model = processed["models"].get("1", {})
+            processed["default_model"] = first_model.get("id")
+            processed["coding_model"] = processed["coding_model"] or processed["default_model"]
+
+        providers[provider_id] = processed
+
+    if validation_errors:
+        import warnings
+        for error in validation_errors:
+            warnings.warn(f"Config validation: {error}")
+
+    # Determine default provider
+    default_provider = json_config.get("default_provider", "perplexity")
+
+    # Ensure perplexity is always available as fallback
+    if "perplexity" not in providers:
+        providers["perplexity"] = {
+            **BUILTIN_PROVIDERS["perplexity"],
+            "models": _convert_models_format(BUILTIN_PROVIDERS["perplexity"]["models"]),
+            "capabilities": MappingProxyType(dict(BUILTIN_PROVIDERS["perplexity"]["capabilities"])),
+        }
+
+    return {
+        "config_source": config_path,
+        "default_provider": default_provider,
+        "providers": providers,
+    }
 
 
 def load_config() -> Dict[str, Any]:
     """Load the complete configuration from JSON file and environment.
 
+    A JSON config file is only re-parsed when its mtime or size changes.
+
     Returns:
         Complete configuration dictionary with:
         - config_source: Path to loaded config file or "builtin"
@@ -279,61 +426,22 @@ def load_config() -> Dict[str, Any]:
         - providers: Dict of all provider configurations
     """
     config_path = _find_config_file()
-
+    st = None
     if config_path:
-        # Load from JSON file
-        json_config = _load_json_config(config_path)
-
-        # Validate and process providers
-        providers = {}
-        validation_errors = []
-
-        for provider_id, provider_config in json_config.get("providers", {}).items():
-            errors = _validate_provider_config(provider_id, provider_config)
-            if errors:
-                validation_errors.extend(errors)
-                continue
-
-            # Convert models format and ensure all fields
-            processed = {
-                "name": provider_config["name"],
-                "base_url": provider_config["base_url"],
-                "api_key_env": provider_config["api_key_env"],
-                "default_model": provider_config.get("default_model"),
-                "coding_model": provider_config.get("coding_model", provider_config.get("default_model")),
-                "models": _convert_models_format(provider_config.get("models", {})),
-                "pricing": provider_config.get("pricing", {}),
-                "capabilities": {**DEFAULT_CAPABILITIES, **provider_config.get("capabilities", {})},
-            }
-
-            # Set default_model to first model if not specified
-            if not processed["default_model"] and processed["models"]:
-                first_model = processed["models"].get("1", {})
-                processed["default_model"] = first_model.get("id")
-                processed["coding_model"] = processed["coding_model"] or processed["default_model"]
-
-            providers[provider_id] = processed
+        try:
+            st = config_path.stat()
+        except OSError:
+            # The cached location went away; search again
+            _config_path_cache.clear()
+            config_path = _find_config_file()
+            if config_path:
+                try:
+                    st = config_path.stat()
+                except OSError as e:
+                    raise ValueError(f"Error reading config file {config_path}: {e}")
 
-        if validation_errors:
-            import warnings
-            for error in validation_errors:
-                warnings.warn(f"Config validation: {error}")
-
-        # Determine default provider
-        default_provider = json_config.get("default_provider", "perplexity")
-
-        # Ensure perplexity is always available as fallback
-        if "perplexity" not in providers:
-            providers["perplexity"] = {
-                **BUILTIN_PROVIDERS["perplexity"],
-                "models": _convert_models_format(BUILTIN_PROVIDERS["perplexity"]["models"]),
-            }
-
-        return {
-            "config_source": str(config_path),
-            "default_provider": default_provider,
-            "providers": providers,
-        }
+    if config_path:
+        return _load_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
 
     else:
         # No config file found - use builtin providers + legacy custom provider
@@ -342,6 +450,7 @@ def load_config() -> Dict[str, Any]:
             providers[provider_id] = {
                 **provider_config,
                 "models": _convert_models_format(provider_config["models"]),
+                "capabilities": MappingProxyType(dict(provider_config["capabilities"])),
             }
 
         # Check for legacy custom provider
@@ -350,6 +459,7 @@ def load_config() -> Dict[str, Any]:
             providers["custom"] = {
                 **legacy_custom,
                 "models": _convert_models_format(legacy_custom["models"]),
+                "capabilities": MappingProxyType(legacy_custom["capabilities"]),
             }
 
         return {
@@ -367,14 +477,91 @@ def load_config() -> Dict[str, Any]:
 _config = load_config()
 
 # Active provider (can be overridden by MODEL_PROVIDER env var)
-MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", _config["default_provider"])
+MODEL_PROVIDER = cached_getenv("MODEL_PROVIDER") or _config["default_provider"]
+
+# Providers dictionary (for backward compatibility). Read-only, so the getters can
+# hand out the same inner mappings without defensive copies.
+PROVIDERS: Mapping[str, Mapping[str, Any]] = _freeze(_config["providers"])
+
+
+# Per-field provider lookups, rebuilt by _index_providers()
+_api_key_env_by_provider: Dict[str, str] = {}
+_base_url_by_provider: Dict[str, str] = {}
+_capabilities_by_provider: Dict[str, Mapping[str, bool]] = {}
+_coding_model_by_provider: Dict[str, str] = {}
+_default_model_by_provider: Dict[str, str] = {}
+_needs_tool_table: Dict[Tuple[str, str], bool] = {}
+
 
-# Providers dictionary (for backward compatibility)
-PROVIDERS = _config["providers"]
+def _index_providers(providers: Mapping[str, Any]) -> None:
+    """Precompute per-field provider lookups used by the getters below.
+
+    Rebuilt whenever PROVIDERS is replaced, so each getter is a single dict
+    lookup instead of a provider lookup plus a field lookup with a default.
+
+    Args:
+        providers: The providers dictionary from load_config().
+    """
+    global _api_key_env_by_provider, _base_url_by_provider, _capabilities_by_provider
+    global _coding_model_by_provider, _default_model_by_provider, _needs_tool_table
+    # Provider IDs and capability names parsed from JSON are fresh string objects;
+    # interning them lets lookups with the literal names ("perplexity",
+    # "web_search", ...) match by identity before falling back to comparison
+    items = [(sys.intern(pid), cfg) for pid, cfg in providers.items()]
+    _api_key_env_by_provider = {pid: cfg.get("api_key_env", "") for pid, cfg in items}
+    _base_url_by_provider = {pid: cfg.get("base_url", "") for pid, cfg in items}
+    _capabilities_by_provider = {
+        pid: MappingProxyType({
+            sys.intern(name): flag
+            for name, flag in {**DEFAULT_CAPABILITIES, **cfg.get("capabilities", {})}.items()
+        })
+        for pid, cfg in items
+    }
+    # (provider, tool_category) -> needs tool; unknown categories default to True
+    _needs_tool_table = {
+        (pid, category): not has_capability
+        for pid, caps in _capabilities_by_provider.items()
+        for category, has_capability in caps.items()
+    }
+    _coding_model_by_provider = {pid: cfg.get("coding_model", "") for pid, cfg in items}
+    _default_model_by_provider = {pid: cfg.get("default_model", "") for pid, cfg in items}
+
+
+def _provider_field(table: Dict[str, Any], provider: Optional[str], default: Any = "") -> Any:
+    """Look up a precomputed field, falling back to perplexity like get_provider_config."""
+    if provider is None:
+        provider = MODEL_PROVIDER
+    try:
+        return table[provider]
+    except KeyError:
+        return table.get("perplexity", default)
+
+
+# provider -> API key, resolved from the environment by refresh_api_keys()
+_api_keys: Dict[str, str] = {}
+
+
+def refresh_api_keys() -> Dict[str, str]:
+    """Re-read every provider's API key from the environment.
+
+    Keys are resolved once at startup and on reload_config(); call this after
+    changing API key environment variables at runtime (e.g. in tests).
+
+    Returns:
+        Dict mapping provider ID to API key (empty string if not set).
+    """
+    global _api_keys
+    _ensure_dotenv_loaded()
+    _api_keys = {pid: os.environ.get(env_name, "") for pid, env_name in _api_key_env_by_provider.items()}
+    return _api_keys
+
+
+_index_providers(PROVIDERS)
+refresh_api_keys()
 
 # Legacy compatibility exports
 MODEL_PRICING = BUILTIN_PROVIDERS["perplexity"]["pricing"]
-MODELS = _config["providers"].get("perplexity", {}).get("models", {})
+MODELS = PROVIDERS.get("perplexity", {}).get("models", {})
 CODING_MODEL = "sonar-pro"
 
 
@@ -400,21 +587,21 @@ def get_available_providers() -> List[str]:
     return list(PROVIDERS.keys())
 
 
-def get_provider_config(provider: str = None) -> dict:
+def get_provider_config(provider: str = None) -> Mapping[str, Any]:
     """Get configuration for the specified provider.
 
     Args:
         provider: Provider ID. If None, uses active provider.
 
     Returns:
-        Provider configuration dictionary.
+        Read-only provider configuration mapping.
     """
     if provider is None:
         provider = MODEL_PROVIDER
     return PROVIDERS.get(provider, PROVIDERS.get("perplexity", {}))
 
 
-def get_active_models() -> dict:
+def get_active_models() -> Mapping[str, Any]:
     """Get models for the active provider.
 
     Returns:
@@ -423,7 +610,7 @@ def get_active_models() -> dict:
     return get_provider_config()["models"]
 
 
-def get_active_pricing() -> dict:
+def get_active_pricing() -> Mapping[str, Any]:
     """Get pricing for the active provider.
 
     Returns:
@@ -435,14 +622,15 @@ def get_active_pricing() -> dict:
 def get_api_key(provider: str = None) -> str:
     """Get API key for the specified provider from environment.
 
+    Keys are read from the environment at startup; see refresh_api_keys().
+
     Args:
         provider: Provider ID. If None, uses active provider.
 
     Returns:
         API key string (empty if not set).
     """
-    config = get_provider_config(provider)
-    return os.getenv(config.get("api_key_env", ""), "")
+    return _provider_field(_api_keys, provider)
 
 
 def get_base_url(provider: str = None) -> str:
@@ -454,10 +642,10 @@ def get_base_url(provider: str = None) -> str:
     Returns:
         Base URL string.
     """
-    return get_provider_config(provider).get("base_url", "")
+    return _provider_field(_base_url_by_provider, provider)
 
 
-def get_provider_capabilities(provider: str = None) -> dict:
+def get_provider_capabilities(provider: str = None) -> Mapping[str, bool]:
     """Get capabilities for the specified provider.
 
     Capabilities indicate what the provider can do natively without tools:
@@ -470,10 +658,9 @@ def get_provider_capabilities(provider: str = None) -> dict:
         provider: Provider ID. If None, uses active provider.
 
     Returns:
-        Dict with capability flags (default False if not specified).
+        Read-only mapping of capability flags (default False if not specified).
     """
-    config = get_provider_config(provider)
-    return config.get("capabilities", DEFAULT_CAPABILITIES)
+    return _provider_field(_capabilities_by_provider, provider, _DEFAULT_CAPS)
 
 
 def provider_needs_tool(provider: str, tool_category: str) -> bool:
@@ -486,9 +673,12 @@ def provider_needs_tool(provider: str, tool_category: str) -> bool:
     Returns:
         True if the provider needs this tool (doesn't have native capability)
     """
-    capabilities = get_provider_capabilities(provider)
+    if provider is None:
+        provider = MODEL_PROVIDER
+    if provider not in _capabilities_by_provider:
+        provider = "perplexity"  # same fallback as get_provider_config
     # Provider needs the tool if it doesn't have the native capability
-    return not capabilities.get(tool_category, False)
+    return _needs_tool_table.get((provider, tool_category), True)
 
 
 def get_coding_model(provider: str = None) -> str:
@@ -500,7 +690,7 @@ def get_coding_model(provider: str = None) -> str:
     Returns:
         Model ID string.
     """
-    return get_provider_config(provider).get("coding_model", "")
+    return _provider_field(_coding_model_by_provider, provider)
 
 
 def get_default_model(provider: str = None) -> str:
@@ -512,7 +702,7 @@ def get_default_model(provider: str = None) -> str:
     Returns:
         Model ID string.
     """
-    return get_provider_config(provider).get("default_model", "")
+    return _provider_field(_default_model_by_provider, provider)
 
 
 def set_active_provider(provider: str) -> bool:
@@ -540,10 +730,16 @@ def reload_config() -> Dict[str, Any]:
         The newly loaded configuration.
     """
     global _config, PROVIDERS, MODEL_PROVIDER
+    # An explicit reload searches again and re-reads the file, even if its mtime looks unchanged
+    _config_path_cache.clear()
+    _load_config_cached.cache_clear()
+    invalidate_env_cache()
     _config = load_config()
-    PROVIDERS = _config["providers"]
+    PROVIDERS = _freeze(_config["providers"])
+    _index_providers(PROVIDERS)
+    refresh_api_keys()
     # Re-apply MODEL_PROVIDER override if set
-    env_provider = os.getenv("MODEL_PROVIDER")
+    env_provider = cached_getenv("MODEL_PROVIDER")
     if env_provider and env_provider in PROVIDERS:
         MODEL_PROVIDER = env_provider
     elif _config["default_provider"] in PROVIDERS:
@@ -14,7 +14,15 @@ from .types import (
     ProviderCapabilities,
     ToolDefinition,
 )
-from .client import EngineClient
+
+
+def __getattr__(name):
+    # Import EngineClient (providers, tools, session) on first use, so importing
+    # engine.types or engine.context alone stays cheap (PEP 562)
+    if name == "EngineClient":
+        from .client import EngineClient
+        return EngineClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "EventType",
@@ -5,23 +5,86 @@ This is the primary interface for all frontends (TUI, VSCode, Web).
 It has no UI dependencies and communicates via events.
 """
 
+import asyncio
 import json
 import re
-from typing import List, AsyncIterator, Optional, Dict, Any
+from typing import List, AsyncIterator, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 from .types import (
     Message, Event, EventType, UsageStats,
     ProviderInfo, ModelInfo, SessionInfo, ProviderCapabilities
 )
-from ..prompts import CODING_PROMPTS
 from .providers import create_provider, list_registered_providers
 from .providers.base import BaseProvider
 from .tools.manager import ToolManager
-from .tools.builtin import register_all_builtin_tools
 from .session import SessionManager
 from .context import ContextInjector
 
+# Tool-call extraction patterns for _parse_tool_call, compiled once
+# ```json ... ``` or ``` ... ``` blocks
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+# Fallback: a brace-delimited object inside a code block
+_JSON_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```')
+# Start of an inline {"tool": ...} object, allowing whitespace after the brace
+_TOOL_OBJ_RE = re.compile(r'\{\s*"tool"')
+_JSON_DECODER = json.JSONDecoder()
+_NON_SPACE_RE = re.compile(r'\S')
+# Where a tool call may begin inside streamed prose: a complete marker (a JSON
+# code fence or an inline {"tool" object), or the start of one at the end of the
+# text received so far that the next chunk may complete
+_TOOL_MARKER_RE = re.compile(
+    r'(?P<full>```(?:json)?\s*\{|\{\s*"tool")'
+    r'|(?:```(?:j(?:s(?:on?)?)?)?\s*|``?|\{\s*(?:"[tol]{0,4})?)\Z'
+)
+
+# Prepended to every request for providers with citations; providers only read
+# messages, so one instance is shared rather than built per turn
+_CITATION_PROMPT = Message(
+    "system",
+    "When citing sources, always include the full URL in parentheses after "
+    "the citation number, like [1](https://example.com). This helps users "
+    "click through to the sources directly."
+)
+
+
+def _may_start_tool_call(head: str) -> Optional[bool]:
+    """Decide from the start of a streamed response whether it may be a tool call.
+
+    Args:
+        head: Text received so far
+
+    Returns:
+        True if it opens with a JSON object or code fence, False if it is
+        plain prose, or None if only whitespace has arrived so far
+    """
+    match = _NON_SPACE_RE.search(head)
+    if match is None:
+        return None
+    start = head[match.start():match.start() + 3]
+    if start[0] == "{":
+        return True
+    if len(start) < 3:
+        # A fence may still be arriving
+        return None if "```".startswith(start) else False
+    return start == "```"
+
+
+def _find_tool_marker(text: str) -> Optional[Tuple[int, bool]]:
+    """Find where a tool call may begin in streamed prose.
+
+    Args:
+        text: Prose not yet passed on to the client
+
+    Returns:
+        (offset, complete) for the first marker, where complete is False for a
+        partial marker at the end of text, or None if all of text is prose
+    """
+    match = _TOOL_MARKER_RE.search(text)
+    if match is None:
+        return None
+    return match.start(), match.group("full") is not None
+
 
 class EngineClient:
     """Main engine client - the facade for all engine functionality.
@@ -49,6 +112,12 @@ class EngineClient:
         self.context_injector = ContextInjector()
         self.auto_inject_context: bool = True  # Enabled by default
 
+        # list_providers() result; reset by set_provider()
+        self._providers_cache: Optional[List[ProviderInfo]] = None
+
+        # Event loop reused by chat_sync() (asyncio.Runner, Python 3.11+)
+        self._runner = None
+
         # Load configuration
         self._load_config()
 
@@ -76,6 +145,12 @@ class EngineClient:
             self._get_default_model = lambda: None
             self._default_provider = "perplexity"
 
+        # Capabilities are static per provider; build each object once and share it
+        self._provider_caps: Dict[str, ProviderCapabilities] = {
+            provider_id: ProviderCapabilities.from_dict(config.get("capabilities", {}))
+            for provider_id, config in self._providers_config.items()
+        }
+
     # === Context Injection ===
 
     def set_working_dir(self, path: str):
@@ -127,9 +202,7 @@ class EngineClient:
         base_url = self._get_base_url(provider_name)
         provider_config = self._providers_config[provider_name]
 
-        # Parse capabilities from config
-        caps_dict = provider_config.get("capabilities", {})
-        capabilities = ProviderCapabilities.from_dict(caps_dict)
+        capabilities = self.get_provider_capabilities(provider_name)
 
         # Create provider instance
         self.provider = create_provider(
@@ -151,6 +224,7 @@ class EngineClient:
             )
 
         self.provider_name = provider_name
+        self._providers_cache = None
         self.tool_manager.set_provider(provider_name)
         self.session.set_provider(provider_name)
 
@@ -164,13 +238,17 @@ class EngineClient:
     def list_providers(self) -> List[ProviderInfo]:
         """List available providers with their status.
 
+        The list is built once and reused until the provider is switched.
+
         Returns:
             List of ProviderInfo objects
         """
+        if self._providers_cache is not None:
+            return list(self._providers_cache)
+
         providers = []
         for provider_id, config in self._providers_config.items():
             has_key = bool(self._get_api_key(provider_id))
-            caps_dict = config.get("capabilities", {})
 
             providers.append(ProviderInfo(
                 id=provider_id,
@@ -178,12 +256,27 @@ class EngineClient:
                 base_url=config.get("base_url", ""),
                 api_key_env=config.get("api_key_env", ""),
                 has_api_key=has_key,
-                capabilities=ProviderCapabilities.from_dict(caps_dict),
+                capabilities=self.get_provider_capabilities(provider_id),
                 default_model=config.get("default_model", ""),
                 coding_model=config.get("coding_model")
             ))
 
-        return providers
+        self._providers_cache = providers
+        return list(providers)
+
+    def get_provider_capabilities(self, provider_name: str) -> ProviderCapabilities:
+        """Get the native capabilities configured for a provider.
+
+        Args:
+            provider_name: Provider ID
+
+        Returns:
+            Shared ProviderCapabilities instance (defaults if not configured)
+        """
+        caps = self._provider_caps.get(provider_name)
+        if caps is None:
+            caps = ProviderCapabilities()
+        return caps
 
     def get_current_provider(self) -> Optional[str]:
         """Get the current provider name.
@@ -207,13 +300,8 @@ class EngineClient:
         if not self.provider:
             return False
 
-        models = self.provider.list_models()
-        if any(m.id == model_id for m in models):
-            self.model = model_id
-            self.session.set_model(model_id)
-            return True
-
-        # Allow setting model even if not in list (for flexibility)
+        # Models outside the provider's list are allowed too (for flexibility),
+        # so there is nothing to look up
         self.model = model_id
         self.session.set_model(model_id)
         return True
@@ -246,6 +334,7 @@ class EngineClient:
         """
         if not self.tools_enabled:
             # Register all built-in tools
+            from .tools.builtin import register_all_builtin_tools
             register_all_builtin_tools(self.tool_manager, self.provider_name)
             self.tools_enabled = True
         return True
@@ -291,7 +380,7 @@ class EngineClient:
         """
         return {
             "enabled": self.tools_enabled,
-            "tool_count": len(self.tool_manager.list_tools()) if self.tools_enabled else 0,
+            "tool_count": self.tool_manager.tool_count if self.tools_enabled else 0,
             "max_iterations": self.tool_manager.max_iterations
         }
 
@@ -359,13 +448,7 @@ class EngineClient:
 
         # Add system prompt for inline citation URLs if provider has web search/citations
         if self.provider and (self.provider.capabilities.citations or self.provider.capabilities.web_search):
-            citation_prompt = Message(
-                "system",
-                "When citing sources, always include the full URL in parentheses after "
-                "the citation number, like [1](https://example.com). This helps users "
-                "click through to the sources directly."
-            )
-            messages = [citation_prompt] + messages
+            messages.insert(0, _CITATION_PROMPT)
 
         async for event in self.provider.chat(messages, self.model, stream):
             yield event
@@ -384,6 +467,20 @@ class EngineClient:
         # Emit stream start at beginning
         yield Event(EventType.STREAM_START, {"model": self.model})
 
+        # The tool prompt does not change while the loop runs; build its system message once
+        system_message = None
+        tool_prompt = self.tool_manager.get_tools_prompt()
+        if tool_prompt:
+            # Add citation URL instruction if provider has web search/citations OR web_search tool is available
+            has_native_search = self.provider and (self.provider.capabilities.citations or self.provider.capabilities.web_search)
+            has_search_tool = self.tool_manager.get_tool("web_search") is not None
+            if has_native_search or has_search_tool:
+                tool_prompt += (
+                    "\n\nWhen citing sources or URLs from search results, format them as markdown links "
+                    "like [Source Name](https://example.com) so they are clickable."
+                )
+            system_message = Message("system", tool_prompt)
+
         while iteration < max_iterations:
             iteration += 1
 
@@ -391,30 +488,45 @@ class EngineClient:
             if iteration > 1:
                 yield Event(EventType.INFO, f"Processing... (iteration {iteration})")
 
-            # Build messages with tool prompt
-            messages = self.session.get_messages()
-
-            # Add system message with tool prompt
-            tool_prompt = self.tool_manager.get_tools_prompt()
-            if tool_prompt:
-                # Add citation URL instruction if provider has web search/citations OR web_search tool is available
-                has_native_search = self.provider and (self.provider.capabilities.citations or self.provider.capabilities.web_search)
-                has_search_tool = self.tool_manager.get_tool("web_search") is not None
-                if has_native_search or has_search_tool:
-                    tool_prompt += (
-                        "\n\nWhen citing sources or URLs from search results, format them as markdown links "
-                        "like [Source Name](https://example.com) so they are clickable."
-                    )
-                messages = [Message("system", tool_prompt)] + messages
-
-            # Get response from provider
+            # Build messages with tool prompt (one list copy of the history)
+            if system_message is not None:
+                messages = [system_message, *self.session.messages]
+            else:
+                messages = self.session.get_messages()
+
+            # Get response from provider in a single request. Chunks are held back
+            # while the response could still be a tool call: from the start until
+            # it turns out to be prose, and again from any tool-call marker that
+            # appears in the prose, so a call is never shown as text.
             full_response = ""
-            async for event in self.provider.chat(messages, self.model, stream=False):
+            end_event = None
+            head = ""
+            passthrough = False
+            holding = False
+            async for event in self.provider.chat(messages, self.model, stream=stream):
                 if event.type == EventType.ERROR:
                     yield event
                     return
+                elif event.type == EventType.STREAM_CHUNK:
+                    head += event.data
+                    if holding:
+                        continue
+                    if not passthrough:
+                        if _may_start_tool_call(head) is not False:
+                            continue
+                        passthrough = True
+                    marker = _find_tool_marker(head)
+                    if marker is None:
+                        yield Event(EventType.STREAM_CHUNK, head)
+                        head = ""
+                        continue
+                    offset, holding = marker
+                    if offset:
+                        yield Event(EventType.STREAM_CHUNK, head[:offset])
+                        head = head[offset:]
                 elif event.type == EventType.STREAM_END:
                     full_response = event.data
+                    end_event = event
 
             # Check for tool call
             tool_call = self._parse_tool_call(full_response)
@@ -428,19 +540,23 @@ class EngineClient:
                     "arguments": tool_args
                 })
 
+                # Compact JSON for the model; export re-renders it from the metadata
+                call_message = Message(
+                    "assistant",
+                    f"I'll use the {tool_name} tool.\n```json\n{json.dumps(tool_call)}\n```",
+                    {"tool_call": tool_call}
+                )
+
                 # Execute tool
                 try:
                     result = await self.tool_manager.execute_tool(tool_name, **tool_args)
                     yield Event(EventType.TOOL_RESULT, {
                         "tool": tool_name,
-                        "result": result[:2000] + "..." if len(result) > 2000 else result
+                        "result": result if len(result) <= 2000 else f"{result[:2000]}..."
                     })
 
                     # Add to conversation history
-                    self.session.add_message(Message(
-                        "assistant",
-                        f"I'll use the {tool_name} tool.\n```json\n{json.dumps(tool_call, indent=2)}\n```"
-                    ))
+                    self.session.add_message(call_message)
                     self.session.add_message(Message(
                         "user",
                         f"The {tool_name} tool returned:\n\n{result}\n\nNow use this information to answer my original question. Do NOT just repeat or echo the tool output - synthesize it into a helpful response. If you need more information, call another tool."
@@ -453,10 +569,7 @@ class EngineClient:
                         "error": error_msg
                     })
 
-                    self.session.add_message(Message(
-                        "assistant",
-                        f"I'll use the {tool_name} tool.\n```json\n{json.dumps(tool_call, indent=2)}\n```"
-                    ))
+                    self.session.add_message(call_message)
                     self.session.add_message(Message(
                         "user",
                         f"The {tool_name} tool failed with error: {error_msg}\n\nPlease provide an answer without using that tool, or try a different approach."
@@ -466,16 +579,11 @@ class EngineClient:
                 continue
 
             else:
-                # No tool call - this is the final response
-                if stream:
-                    # Re-request with streaming for final response
-                    async for event in self.provider.chat(messages, self.model, stream=True):
-                        yield event
-                        if event.type == EventType.STREAM_END:
-                            self.session.add_message(Message("assistant", event.data))
-                else:
-                    self.session.add_message(Message("assistant", full_response))
-                    yield Event(EventType.STREAM_END, full_response)
+                # No tool call - this is the final response; release anything held back
+                if head:
+                    yield Event(EventType.STREAM_CHUNK, head)
+                self.session.add_message(Message("assistant", full_response))
+                yield end_event or Event(EventType.STREAM_END, full_response)
 
                 return
 
@@ -495,6 +603,10 @@ class EngineClient:
         Returns:
             Tool call dict with 'tool' and 'arguments' keys, or None
         """
+        # Every form below needs a "tool" key; plain prose skips all parsing
+        if '"tool"' not in text:
+            return None
+
         def normalize_tool_call(data: dict) -> Optional[dict]:
             if "tool" not in data:
                 return None
@@ -508,32 +620,30 @@ class EngineClient:
                 return data
 
             # Model put parameters at top level
-            expected_params = set(tool.parameters.get("properties", {}).keys())
-            arguments = {}
-            for key, value in data.items():
-                if key != "tool" and key in expected_params:
-                    arguments[key] = value
+            expected_params = self.tool_manager.get_expected_params(tool_name)
+            arguments = {key: value for key, value in data.items() if key != "tool" and key in expected_params}
 
             if arguments:
                 return {"tool": tool_name, "arguments": arguments}
 
             return None
 
-        # Try entire response as JSON first (most common case for tool calls)
-        text_stripped = text.strip()
-        if text_stripped.startswith('{') and text_stripped.endswith('}'):
+        # Try entire response as JSON first (most common case for tool calls).
+        # Locate the first/last non-space by index instead of strip()ping a copy.
+        first = _NON_SPACE_RE.search(text)
+        if first and text[first.start()] == '{':
             try:
-                data = json.loads(text_stripped)
-                normalized = normalize_tool_call(data)
-                if normalized:
-                    return normalized
-            except json.JSONDecodeError:
+                data, end = _JSON_DECODER.raw_decode(text, first.start())
+            except ValueError:
                 pass
+            else:
+                if _NON_SPACE_RE.search(text, end) is None:
+                    normalized = normalize_tool_call(data)
+                    if normalized:
+                        return normalized
 
         # Try extracting JSON from markdown code blocks
-        # Match ```json ... ``` or ``` ... ``` blocks
-        code_block_pattern = r'```(?:json)?\s*([\s\S]*?)```'
-        matches = re.findall(code_block_pattern, text)
+        matches = _CODE_BLOCK_RE.findall(text)
 
         for match in matches:
             match_stripped = match.strip()
@@ -547,8 +657,7 @@ class EngineClient:
                     pass
 
         # Try JSON in code blocks - use greedy match for nested braces (fallback)
-        code_block_pattern2 = r'```(?:json)?\s*(\{[\s\S]*?\})\s*```'
-        matches = re.findall(code_block_pattern2, text)
+        matches = _JSON_CODE_BLOCK_RE.findall(text)
 
         for match in matches:
             # Try to parse, and if it fails due to incomplete JSON, expand the match
@@ -560,37 +669,19 @@ class EngineClient:
             except json.JSONDecodeError:
                 continue
 
-        # Try to find JSON objects with "tool" key using a more robust approach
-        # Look for complete JSON objects by counting braces
-        start_idx = 0
-        while True:
-            start = text.find('{"tool"', start_idx)
-            if start == -1:
-                break
-
-            # Find matching closing brace
-            depth = 0
-            end = start
-            for i, char in enumerate(text[start:], start):
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-
-            if depth == 0 and end > start:
-                json_str = text[start:end]
-                try:
-                    data = json.loads(json_str)
-                    normalized = normalize_tool_call(data)
-                    if normalized:
-                        return normalized
-                except json.JSONDecodeError:
-                    pass
-
-            start_idx = end if end > start else start + 1
+        # Try inline JSON objects starting with {"tool" (or { "tool"); raw_decode parses
+        # one complete object (nested braces, braces inside strings) and reports its end
+        end = 0
+        for match in _TOOL_OBJ_RE.finditer(text):
+            if match.start() < end:
+                continue  # inside an object already decoded
+            try:
+                data, end = _JSON_DECODER.raw_decode(text, match.start())
+            except ValueError:
+                continue
+            normalized = normalize_tool_call(data)
+            if normalized:
+                return normalized
 
         return None
 
@@ -604,8 +695,6 @@ class EngineClient:
         Returns:
             Assistant response content
         """
-        import asyncio
-
         result = ""
 
         async def run():
@@ -616,9 +705,34 @@ class EngineClient:
                 elif event.type == EventType.ERROR:
                     result = f"Error: {event.data}"
 
-        asyncio.run(run())
+        if hasattr(asyncio, "Runner"):
+            # Keep one loop across calls instead of creating one per request
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+            self._runner.run(run())
+        else:
+            asyncio.run(run())
         return result
 
+    def close_loop(self):
+        """Close the event loop used by chat_sync(), if one was created."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
+    def close(self):
+        """Clean up resources from synchronous code, then close the chat_sync() loop.
+
+        Tools started by chat_sync() live on its loop, so cleanup() runs there.
+        """
+        try:
+            if self._runner is not None:
+                self._runner.run(self.cleanup())
+            else:
+                asyncio.run(self.cleanup())
+        finally:
+            self.close_loop()
+
     # === Coding Tasks ===
 
     async def coding_task(
@@ -641,6 +755,8 @@ class EngineClient:
         Yields:
             Event objects
         """
+        from ..prompts import CODING_PROMPTS
+
         if task_type not in CODING_PROMPTS:
             yield Event(EventType.ERROR, f"Unknown task type: {task_type}")
             return
@@ -749,7 +865,7 @@ class EngineClient:
             "provider": self.provider_name,
             "model": self.model,
             "tools_enabled": self.tools_enabled,
-            "tool_count": len(self.tool_manager.list_tools()) if self.tools_enabled else 0,
+            "tool_count": self.tool_manager.tool_count if self.tools_enabled else 0,
             "auto_inject_context": self.auto_inject_context,
             "has_api_key": self.provider is not None,
             "message_count": len(self.session.messages)
@@ -759,4 +875,5 @@ class EngineClient:
 
     async def cleanup(self):
         """Clean up resources."""
+        self.session.close()
         await self.tool_manager.cleanup()
@@ -5,12 +5,86 @@ Detects file references in messages and injects content directly into prompts,
 eliminating the need for tool calls for simple file reading operations.
 """
 
+import codecs
 import re
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
+# Every reference FILE_PATTERNS or the quoted pattern can match ends in ".ext";
+# messages without a dot followed by a word character cannot reference a file
+_REF_HINT_RE = re.compile(r'\.\w')
+
+
+# Size units for _format_size
+_KB = 1024
+_MB = 1024 * 1024
+
+# Extensions skipped without opening the file
+_BINARY_EXT = frozenset({
+    '.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe',
+    '.o', '.a', '.lib', '.obj',
+    '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar',
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp',
+    '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.db', '.sqlite', '.sqlite3',
+    '.wasm', '.class', '.jar',
+})
+
+# Bytes that occur in text files: common control characters plus everything from
+# space up (UTF-8 multi-byte sequences use 0x80-0xff)
+_TEXTCHARS = bytes({7, 8, 9, 10, 12, 13, 27}) + bytes(range(0x20, 0x100))
+
+
+def _looks_binary(chunk: bytes) -> bool:
+    """Check the first bytes of a file for binary content.
+
+    A null byte, or more than 30% bytes outside _TEXTCHARS, means binary.
+    bytes.translate counts the non-text bytes in C.
+    """
+    if b'\x00' in chunk:
+        return True
+    return len(chunk.translate(None, _TEXTCHARS)) > len(chunk) * 0.3
+
+
+@lru_cache(maxsize=32)
+def _cached_read(path_str: str, mtime_ns: int, size: int, max_bytes: int) -> Optional[Tuple[str, bool]]:
+    """Read, sniff and truncate a file with a single open.
+
+    At most max_bytes + 1 bytes are read (the extra byte detects truncation), so
+    the part of a file past the limit is never read or decoded. mtime_ns and size
+    only key the cache, so edited files are read again.
+
+    Returns:
+        Tuple of (content, truncated), or None if the content looks binary
+    """
+    fd = os.open(path_str, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = []
+        remaining = max_bytes + 1
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    data = b"".join(chunks)
+
+    if _looks_binary(data[:1024]):
+        return None
+    if len(data) > max_bytes:
+        # Drop a multi-byte character cut at the limit instead of decoding it to U+FFFD
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        return decoder.decode(data[:max_bytes]), True
+    return data.decode('utf-8', errors='replace'), False
+
 
 @dataclass
 class InjectedContext:
@@ -27,12 +101,20 @@ class ContextInjector:
 
     MAX_FILE_SIZE = 100_000  # ~100KB max per file
     MAX_TOTAL_CONTEXT = 200_000  # ~200KB total injected context
+    PARALLEL_READ_MIN_FILES = 3  # read this many or more files in a thread pool
+    PARALLEL_READ_WORKERS = 8
 
     # Patterns to detect file references
     FILE_PATTERNS = [
         r'(?:^|\s)([./~][\w./\-_]+\.\w+)',   # ./path/file.ext, ~/file.ext
         r'(?:^|\s)(/[\w./\-_]+\.\w+)',        # /absolute/path/file.ext
     ]
+    # Quoted paths: "file name.ext" or 'file.ext'
+    QUOTED_PATTERN = r'["\']([^"\']+\.\w+)["\']'
+    # FILE_PATTERNS fused into one alternation (each alternative has exactly one
+    # group); quoted paths can overlap them, so they are scanned separately
+    _FILE_REF_RE = re.compile('|'.join(FILE_PATTERNS), re.MULTILINE)
+    _QUOTED_RE = re.compile(QUOTED_PATTERN)
 
     # Keywords that suggest user wants file content
     FILE_KEYWORDS = [
@@ -40,6 +122,8 @@ class ContextInjector:
         'explain', 'review', 'analyze', 'look at', 'check',
         'summarize', 'describe', 'parse', 'examine', 'inspect',
     ]
+    # One case-insensitive scan for any keyword, without lowercasing a copy
+    _KEYWORD_RE = re.compile('|'.join(map(re.escape, FILE_KEYWORDS)), re.IGNORECASE)
 
     # Language detection mapping
     LANGUAGE_MAP = {
@@ -56,7 +140,7 @@ class ContextInjector:
         '.php': 'php',
         '.swift': 'swift',
         '.scala': 'scala',
-        '.r': 'r', '.R': 'r',
+        '.r': 'r',
         '.sh': 'bash', '.bash': 'bash', '.zsh': 'zsh', '.fish': 'fish',
         '.ps1': 'powershell', '.psm1': 'powershell',
         '.sql': 'sql',
@@ -101,6 +185,11 @@ class ContextInjector:
         """Set the working directory for relative paths."""
         self.working_dir = path
 
+    @staticmethod
+    def clear_read_cache():
+        """Drop cached file contents (they are otherwise reused until a file changes)."""
+        _cached_read.cache_clear()
+
     def detect_file_references(self, message: str) -> List[str]:
         """Detect file paths mentioned in the message.
 
@@ -110,17 +199,16 @@ class ContextInjector:
         Returns:
             List of detected file paths
         """
-        files = []
-        for pattern in self.FILE_PATTERNS:
-            matches = re.findall(pattern, message, re.MULTILINE)
-            files.extend(matches)
+        # Every pattern needs a ".ext"; without a dot there is nothing to scan for
+        if '.' not in message:
+            return []
 
-        # Also check for quoted paths
-        quoted_pattern = r'["\']([^"\']+\.\w+)["\']'
-        quoted_matches = re.findall(quoted_pattern, message)
-        files.extend(quoted_matches)
-
-        return list(set(files))  # dedupe
+        # lastindex is the one group of whichever alternative matched
+        files = [m[m.lastindex] for m in self._FILE_REF_RE.finditer(message)]
+        # Quoted paths get their own scan: a quote may wrap a bare path, and both
+        # must be found
+        files.extend(self._QUOTED_RE.findall(message))
+        return list(dict.fromkeys(files))  # dedupe, keeping first-mention order
 
     def should_inject(self, message: str, files: List[str]) -> bool:
         """Determine if we should auto-inject file contents.
@@ -135,18 +223,13 @@ class ContextInjector:
         if not files:
             return False
 
-        msg_lower = message.lower()
-
         # Check for explicit keywords
-        if any(kw in msg_lower for kw in self.FILE_KEYWORDS):
-            return True
-
-        # Check if message is primarily about the file (short message + file path)
-        words = message.split()
-        if len(words) <= 10 and files:
+        if self._KEYWORD_RE.search(message):
             return True
 
-        return False
+        # Check if message is primarily about the file (short message + file path).
+        # maxsplit stops after 11 words, so long messages are not split in full.
+        return len(message.split(None, 10)) <= 10
 
     def resolve_path(self, filepath: str) -> Optional[Path]:
         """Resolve a file path to an absolute path.
@@ -157,6 +240,18 @@ class ContextInjector:
         Returns:
             Resolved Path object, or None if invalid
         """
+        resolved = self._resolve(filepath)
+        return resolved[0] if resolved else None
+
+    def _resolve(self, filepath: str) -> Optional[Tuple[Path, os.stat_result]]:
+        """Resolve a file path and stat it once.
+
+        Args:
+            filepath: File path (relative, absolute, or with ~)
+
+        Returns:
+            Tuple of (resolved path, stat result), or None if not a regular file
+        """
         # Expand ~ to home directory
         if filepath.startswith('~'):
             filepath = os.path.expanduser(filepath)
@@ -164,14 +259,19 @@ class ContextInjector:
         elif not filepath.startswith('/'):
             filepath = os.path.join(self.working_dir, filepath)
 
-        path = Path(filepath).resolve()
+        resolved = os.path.realpath(filepath)
 
         # Security: don't allow path traversal outside working dir for relative paths
         # (absolute paths are explicit, so we allow them)
-        if not path.exists() or not path.is_file():
+        # One stat answers both "exists" and "is a regular file"
+        try:
+            st = os.stat(resolved)
+        except (OSError, ValueError):
+            return None
+        if not stat.S_ISREG(st.st_mode):
             return None
 
-        return path
+        return Path(resolved), st
 
     def read_file(self, filepath: str) -> Optional[InjectedContext]:
         """Read a file and return its content.
@@ -182,22 +282,25 @@ class ContextInjector:
         Returns:
             InjectedContext with file content, or None if unreadable
         """
-        path = self.resolve_path(filepath)
-        if path is None:
+        resolved = self._resolve(filepath)
+        if resolved is None:
             return None
+        path, st = resolved
 
         # Detect language from extension
         lang = self._detect_language(path.suffix)
 
-        # Check if it's a binary file (simple heuristic)
-        if self._is_likely_binary(path):
+        # Known binary types are skipped without opening the file
+        if self._has_binary_extension(path):
             return None
 
         try:
-            original_size = path.stat().st_size
+            original_size = st.st_size
 
             # Don't read files that are too large
             if original_size > self.MAX_FILE_SIZE * 2:
+                if self._is_likely_binary(path):
+                    return None
                 return InjectedContext(
                     source=str(path),
                     content=f"[File too large: {self._format_size(original_size)}]",
@@ -206,12 +309,12 @@ class ContextInjector:
                     size=original_size
                 )
 
-            content = path.read_text(errors='replace')
-            truncated = False
-
-            if len(content) > self.MAX_FILE_SIZE:
-                content = content[:self.MAX_FILE_SIZE]
-                truncated = True
+            # One open reads, sniffs and decodes the file; files referenced again
+            # in later turns come from the cache unless changed
+            result = _cached_read(str(path), st.st_mtime_ns, original_size, self.MAX_FILE_SIZE)
+            if result is None:
+                return None  # binary content
+            content, truncated = result
 
             return InjectedContext(
                 source=str(path),
@@ -232,19 +335,29 @@ class ContextInjector:
         Returns:
             Tuple of (modified_message, list_of_injected_contexts)
         """
-        files = self.detect_file_references(message)
+        # Fast path for plain-text messages: no regex scans, no filesystem work
+        if not _REF_HINT_RE.search(message):
+            return message, []
 
+        files = self.detect_file_references(message)
         if not self.should_inject(message, files):
             return message, []
 
+        if len(files) >= self.PARALLEL_READ_MIN_FILES:
+            # Overlap the I/O latency of many files; the budget is applied below, in
+            # order, so a few files past it may be read but are not attached
+            with ThreadPoolExecutor(max_workers=min(self.PARALLEL_READ_WORKERS, len(files))) as pool:
+                contexts = list(pool.map(self.read_file, files))
+        else:
+            contexts = map(self.read_file, files)  # lazy: stops reading at the budget
+
         injected = []
         total_size = 0
 
-        for filepath in files:
+        for ctx in contexts:
             if total_size >= self.MAX_TOTAL_CONTEXT:
                 break
 
-            ctx = self.read_file(filepath)
             if ctx:
                 injected.append(ctx)
                 total_size += len(ctx.content)
@@ -252,16 +365,18 @@ class ContextInjector:
         if not injected:
             return message, []
 
-        # Build enhanced message with injected content
-        enhanced = message + "\n\n---\n**Attached file contents:**\n"
+        # Build enhanced message with injected content (joined once, not grown with +=)
+        parts = [message, "\n\n---\n**Attached file contents:**\n"]
 
         for ctx in injected:
             truncation_note = " *(truncated)*" if ctx.truncated else ""
             size_str = self._format_size(ctx.size)
-            enhanced += f"\n**`{ctx.source}`** ({size_str}){truncation_note}:\n"
-            enhanced += f"```{ctx.language}\n{ctx.content}\n```\n"
+            parts.append(f"\n**`{ctx.source}`** ({size_str}){truncation_note}:\n")
+            parts.append(f"```{ctx.language}\n")
+            parts.append(ctx.content)
+            parts.append("\n```\n")
 
-        return enhanced, injected
+        return "".join(parts), injected
 
     def _detect_language(self, suffix: str) -> str:
         """Detect language from file extension.
@@ -272,6 +387,10 @@ class ContextInjector:
         Returns:
             Language identifier for syntax highlighting
         """
+        # Keys are lowercase; most suffixes already are, so try as-is first
+        language = self.LANGUAGE_MAP.get(suffix)
+        if language is not None:
+            return language
         return self.LANGUAGE_MAP.get(suffix.lower(), '')
 
     def _is_likely_binary(self, path: Path) -> bool:
@@ -283,30 +402,30 @@ class ContextInjector:
         Returns:
             True if file appears to be binary
         """
-        binary_extensions = {
-            '.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe',
-            '.o', '.a', '.lib', '.obj',
-            '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar',
-            '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp',
-            '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.db', '.sqlite', '.sqlite3',
-            '.wasm', '.class', '.jar',
-        }
-
-        if path.suffix.lower() in binary_extensions:
+        suffix = path.suffix.lower()
+        if suffix in _BINARY_EXT:
             return True
+        # Known source/text types need no sniff
+        if suffix in self.LANGUAGE_MAP:
+            return False
 
         # Check first few bytes for null characters
         try:
             with open(path, 'rb') as f:
-                chunk = f.read(1024)
-                if b'\x00' in chunk:
-                    return True
+                return _looks_binary(f.read(1024))
         except Exception:
             return True
 
-        return False
+    def _has_binary_extension(self, path: Path) -> bool:
+        """Check if a file has a known binary extension.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the extension is a known binary type
+        """
+        return path.suffix.lower() in _BINARY_EXT
 
     def _format_size(self, size: int) -> str:
         """Format file size in human readable form.
@@ -317,9 +436,9 @@ class ContextInjector:
         Returns:
             Formatted string like "1.5 KB"
         """
-        if size < 1024:
+        if size < _KB:
             return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
+        elif size < _MB:
+            return f"{size / _KB:.1f} KB"
         else:
-            return f"{size / (1024 * 1024):.1f} MB"
+            return f"{size / _MB:.1f} MB"
@@ -4,26 +4,35 @@ Provider registry and factory.
 Providers are dynamically registered and can be retrieved by name.
 """
 
-from typing import Dict, Type, Optional, List
+import importlib
+from typing import Dict, Type, Optional, List, Union
 from .base import BaseProvider
 
-# Provider registry
-_providers: Dict[str, Type[BaseProvider]] = {}
+# Provider registry: a class, or a "module:Class" path (relative to this package)
+# for built-ins that are imported on first use
+_providers: Dict[str, Union[Type[BaseProvider], str]] = {}
 
 
-def register_provider(name: str, provider_class: Type[BaseProvider]):
-    """Register a provider implementation."""
+def register_provider(name: str, provider_class: Union[Type[BaseProvider], str]):
+    """Register a provider implementation (class or lazy "module:Class" path)."""
     _providers[name] = provider_class
 
 
 def get_provider_class(name: str) -> Optional[Type[BaseProvider]]:
     """Get a provider class by name."""
-    return _providers.get(name)
+    provider_class = _providers.get(name)
+    if isinstance(provider_class, str):
+        module_name, _, class_name = provider_class.partition(":")
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        provider_class = getattr(module, class_name)
+        # Resolve once; later lookups get the class directly
+        _providers[name] = provider_class
+    return provider_class
 
 
 def create_provider(name: str, **kwargs) -> Optional[BaseProvider]:
     """Create an instance of a provider by name."""
-    provider_class = _providers.get(name)
+    provider_class = get_provider_class(name)
     if provider_class is None:
         return None
     return provider_class(**kwargs)
@@ -34,18 +43,24 @@ def list_registered_providers() -> List[str]:
     return list(_providers.keys())
 
 
-# Import and register built-in providers
-# These imports trigger the registration via decorators or explicit calls
-from .openai_compat import OpenAICompatibleProvider
-from .perplexity import PerplexityProvider
+# Register built-in providers. Their modules are imported by the first
+# create_provider()/get_provider_class() call that needs them.
+register_provider("openai", "openai_compat:OpenAICompatibleProvider")
+register_provider("perplexity", "perplexity:PerplexityProvider")
+register_provider("openrouter", "openai_compat:OpenAICompatibleProvider")
+register_provider("gemini", "openai_compat:OpenAICompatibleProvider")
+register_provider("local", "openai_compat:OpenAICompatibleProvider")
+register_provider("custom", "openai_compat:OpenAICompatibleProvider")
+
+
+def __getattr__(name):
+    # Keep `from ppxai.engine.providers import PerplexityProvider` working (PEP 562)
+    if name == "OpenAICompatibleProvider":
+        return get_provider_class("openai")
+    if name == "PerplexityProvider":
+        return get_provider_class("perplexity")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Register providers
-register_provider("openai", OpenAICompatibleProvider)
-register_provider("perplexity", PerplexityProvider)
-register_provider("openrouter", OpenAICompatibleProvider)
-register_provider("gemini", OpenAICompatibleProvider)
-register_provider("local", OpenAICompatibleProvider)
-register_provider("custom", OpenAICompatibleProvider)
 
 __all__ = [
     "BaseProvider",
@@ -5,14 +5,76 @@ All AI providers must implement this interface.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Any, AsyncIterator, Optional
+import asyncio
 import os
-import httpx
-from openai import OpenAI
+import threading
 
 from ..types import Message, Event, EventType, ProviderCapabilities, ModelInfo, UsageStats
 
 
+# (role, content) of a Message in one C-level call
+_role_and_content = attrgetter("role", "content")
+# Token counts of an SDK usage object in one C-level call
+_usage_counts = attrgetter("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+@lru_cache(maxsize=16)
+def _get_openai_client(api_key: str, base_url: str, ssl_verify: bool):
+    """Get an OpenAI client shared by all providers with the same settings.
+
+    Sharing the client shares its connection pool and TLS sessions. The SDK
+    (and httpx) are imported here, not at module load, so the provider
+    registry can be imported without them.
+
+    Args:
+        api_key: API key for authentication
+        base_url: Base URL for the API
+        ssl_verify: Whether to verify TLS certificates
+
+    Returns:
+        Configured OpenAI client
+    """
+    from openai import OpenAI
+
+    if not ssl_verify:
+        return OpenAI(api_key=api_key, base_url=base_url, http_client=_get_insecure_http_client())
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@lru_cache(maxsize=1)
+def _get_insecure_http_client():
+    """Get the one httpx client with certificate verification disabled."""
+    import httpx
+    return httpx.Client(verify=False)
+
+
+# Event loop for chat_sync(), running forever in a daemon thread once started
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_lock = threading.Lock()
+
+
+def _submit(coro) -> Future:
+    """Run a coroutine on the shared background event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future for the coroutine's result
+    """
+    global _bg_loop
+    with _bg_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="ppxai-provider-loop", daemon=True).start()
+            _bg_loop = loop
+    return asyncio.run_coroutine_threadsafe(coro, _bg_loop)
+
+
 class BaseProvider(ABC):
     """Abstract base class for all AI providers.
 
@@ -48,18 +110,7 @@ class BaseProvider(ABC):
         # Check if SSL verification should be disabled
         ssl_verify = os.getenv("SSL_VERIFY", "true").lower() != "false"
 
-        if not ssl_verify:
-            http_client = httpx.Client(verify=False)
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url=base_url,
-                http_client=http_client
-            )
-        else:
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url=base_url
-            )
+        self.client = _get_openai_client(api_key, base_url, ssl_verify)
 
     @abstractmethod
     async def chat(
@@ -96,14 +147,15 @@ class BaseProvider(ABC):
         Returns:
             List of Event objects
         """
-        import asyncio
         events = []
 
         async def collect():
             async for event in self.chat(messages, model, stream):
                 events.append(event)
 
-        asyncio.run(collect())
+        # One long-lived loop instead of a new loop per call; also works when
+        # the caller is itself running inside an event loop
+        _submit(collect()).result()
         return events
 
     def list_models(self) -> List[ModelInfo]:
@@ -140,7 +192,7 @@ class BaseProvider(ABC):
         Returns:
             True if provider needs this tool (doesn't have native capability)
         """
-        return not getattr(self.capabilities, tool_category, False)
+        return self.capabilities.needs(tool_category)
 
     def _convert_messages(self, messages: List[Message]) -> List[Dict[str, str]]:
         """Convert Message objects to API format.
@@ -151,7 +203,7 @@ class BaseProvider(ABC):
         Returns:
             List of dicts with 'role' and 'content' keys
         """
-        return [{"role": m.role, "content": m.content} for m in messages]
+        return [{"role": role, "content": content} for role, content in map(_role_and_content, messages)]
 
     def _parse_usage(self, usage) -> Optional[UsageStats]:
         """Parse usage from API response.
@@ -164,8 +216,15 @@ class BaseProvider(ABC):
         """
         if not usage:
             return None
+        try:
+            prompt, completion, total = _usage_counts(usage)
+        except AttributeError:
+            # Usage objects from other SDK versions may lack a field
+            prompt = getattr(usage, 'prompt_tokens', 0)
+            completion = getattr(usage, 'completion_tokens', 0)
+            total = getattr(usage, 'total_tokens', 0)
         return UsageStats(
-            prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
-            completion_tokens=getattr(usage, 'completion_tokens', 0) or 0,
-            total_tokens=getattr(usage, 'total_tokens', 0) or 0,
+            prompt_tokens=prompt or 0,
+            completion_tokens=completion or 0,
+            total_tokens=total or 0,
         )
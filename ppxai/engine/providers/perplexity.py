@@ -57,14 +57,15 @@ class PerplexityProvider(BaseProvider):
                 )
 
                 full_response = []
+                # STREAM_END carries the full text: the engine stores it in the
+                # session history and tool loop / JSON-RPC consumers read it
                 for chunk in response_stream:
-                    if chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
+                    content = chunk.choices[0].delta.content
+                    if content:
                         full_response.append(content)
                         yield Event(EventType.STREAM_CHUNK, content)
 
-                final_content = "".join(full_response)
-                yield Event(EventType.STREAM_END, final_content)
+                yield Event(EventType.STREAM_END, "".join(full_response))
 
             else:
                 # Non-streaming response
@@ -5,12 +5,70 @@ Handles conversation history, session persistence, and usage tracking.
 """
 
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from .types import Message, UsageStats, SessionInfo
 
+# orjson (optional, "fast" extra) serializes session files several times faster
+# and works on bytes directly; both paths write 2-space indented UTF-8 JSON
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+    _loads = json.loads
+
+
+# Session summaries used by list_sessions(); not a session itself
+INDEX_FILENAME = "_index.json"
+
+# Messages added after a session is saved or loaded are appended to
+# "<name>.jsonl" next to its .json file; save() folds them back in
+LOG_SUFFIX = ".jsonl"
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_MESSAGES = 8
+LOG_FLUSH_SECONDS = 5.0
+
+
+def _index_entry(data: Dict[str, Any], stem: str, mtime_ns: int) -> Dict[str, Any]:
+    """Build a session index row from a parsed session file."""
+    metadata = data.get("metadata", {})
+    return {
+        "name": data.get("session_name", stem),
+        "created_at": metadata.get("created_at", ""),
+        "provider": metadata.get("provider", "unknown"),
+        "model": metadata.get("model", "unknown"),
+        "message_count": len(data.get("messages", [])),
+        "mtime_ns": mtime_ns,
+        # Messages in the append log, counted as of log_mtime_ns
+        "logged": 0,
+        "log_mtime_ns": None,
+    }
+
+
+def _message_to_dict(message: Message) -> Dict[str, Any]:
+    """Serialize a message for a session file (metadata only when set)."""
+    data = {"role": message.role, "content": message.content}
+    if message.metadata:
+        data["metadata"] = message.metadata
+    return data
+
 
 class SessionManager:
     """Manages conversation sessions, history, and persistence."""
@@ -30,6 +88,8 @@ class SessionManager:
 
         self.sessions_dir = Path(sessions_dir)
         self.exports_dir = Path(exports_dir)
+        # Summary rows for list_sessions(), keyed by session file stem
+        self._index_path = self.sessions_dir / INDEX_FILENAME
 
         # Ensure directories exist
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
@@ -38,6 +98,9 @@ class SessionManager:
         # Current session state
         self.session_name = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.messages: List[Message] = []
+        # Serialized form of messages (see _message_to_dict), kept in step by
+        # add_message(); shared by save(), export() and get_messages_as_dicts()
+        self._messages_dicts: List[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {
             "created_at": datetime.now().isoformat(),
             "provider": None,
@@ -46,15 +109,37 @@ class SessionManager:
         }
         self.usage = UsageStats()
 
+        # Append log for the persisted session (None until saved or loaded)
+        # and the session file stem it extends
+        self._log = None
+        self._log_name: Optional[str] = None
+        self._log_pending = 0
+        self._last_flush = 0.0
+
     def add_message(self, message: Message):
         """Add a message to the conversation history.
 
+        Once the session has been saved or loaded, the message is also
+        appended to its log so it survives without rewriting the session file.
+
         Args:
             message: Message to add
         """
         self.messages.append(message)
+        data = _message_to_dict(message)
+        self._messages_dicts.append(data)
         self.metadata["message_count"] = len(self.messages)
 
+        if self._log is not None:
+            try:
+                self._log.write(_dumps_line(data))
+                self._log_pending += 1
+                if (self._log_pending >= LOG_FLUSH_MESSAGES
+                        or time.monotonic() - self._last_flush >= LOG_FLUSH_SECONDS):
+                    self._flush_log()
+            except OSError:
+                self._close_log()  # Fall back to explicit saves only
+
     def get_messages(self) -> List[Message]:
         """Get conversation history.
 
@@ -69,13 +154,88 @@ class SessionManager:
         Returns:
             List of dicts with 'role' and 'content' keys
         """
-        return [{"role": m.role, "content": m.content} for m in self.messages]
+        # Fresh dicts: callers may mutate them, and metadata is left out
+        return [{"role": d["role"], "content": d["content"]} for d in self._messages_dicts]
 
     def clear(self):
         """Clear conversation history."""
+        # The log only extends the saved history; stop until the next save
+        self._close_log()
         self.messages = []
+        self._messages_dicts = []
         self.metadata["message_count"] = 0
 
+    def close(self):
+        """Flush and close the session's append log."""
+        self._close_log()
+
+    def _log_path(self, name: str) -> Path:
+        """Path of a session's append log."""
+        return self.sessions_dir / f"{name}{LOG_SUFFIX}"
+
+    def _open_log(self, name: str, truncate: bool):
+        """Start appending new messages to a session's log.
+
+        Args:
+            name: Session file stem the log extends
+            truncate: Discard entries already folded into the session file
+        """
+        self._close_log()
+        try:
+            self._log = open(self._log_path(name), 'wb' if truncate else 'ab',
+                             buffering=LOG_BUFFER_SIZE)
+            self._log_name = name
+        except OSError:
+            self._log = None
+        self._log_pending = 0
+        self._last_flush = time.monotonic()
+
+    def _flush_log(self):
+        """Write buffered log entries to disk."""
+        self._log.flush()
+        self._log_pending = 0
+        self._last_flush = time.monotonic()
+
+    def _close_log(self):
+        """Flush and close the append log, if open."""
+        if self._log is not None:
+            try:
+                self._log.close()
+            except OSError:
+                pass
+            self._log = None
+            self._log_name = None
+            self._log_pending = 0
+
+    def _read_log(self, name: str, saved_mtime_ns: int) -> List[Dict[str, Any]]:
+        """Read messages appended to a session's log since its last save.
+
+        Args:
+            name: Session file stem
+            saved_mtime_ns: Modification time of the session file
+
+        Returns:
+            Logged message dicts, stopping at a torn or corrupt line
+        """
+        entries = []
+        try:
+            with open(self._log_path(name), 'rb') as f:
+                # A log older than the session file was already folded into it
+                # (save() stopped before truncating the log)
+                if os.fstat(f.fileno()).st_mtime_ns < saved_mtime_ns:
+                    return entries
+                for line in f:
+                    try:
+                        m = _loads(line)
+                    except ValueError:
+                        break
+                    if not isinstance(m, dict) or "role" not in m or "content" not in m:
+                        break
+                    entries.append(m)
+        except OSError:
+            pass
+        return entries
+
     def set_provider(self, provider: str):
         """Set the current provider.
 
@@ -98,10 +258,7 @@ class SessionManager:
         Args:
             usage: UsageStats to add
         """
-        self.usage.prompt_tokens += usage.prompt_tokens
-        self.usage.completion_tokens += usage.completion_tokens
-        self.usage.total_tokens += usage.total_tokens
-        self.usage.estimated_cost += usage.estimated_cost
+        self.usage += usage
 
     def get_usage(self) -> Dict[str, Any]:
         """Get usage statistics.
@@ -125,6 +282,9 @@ class SessionManager:
         Returns:
             Session name
         """
+        # Whatever has been logged is in memory and goes into this file. Under a
+        # new name the old log is left as is: it still extends the old session
+        self._close_log()
         if name:
             self.session_name = name
 
@@ -133,13 +293,27 @@ class SessionManager:
         session_data = {
             "session_name": self.session_name,
             "metadata": self.metadata,
-            "messages": [{"role": m.role, "content": m.content} for m in self.messages],
+            "messages": self._messages_dicts,
             "usage": self.get_usage(),
             "saved_at": datetime.now().isoformat()
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2)
+        # Write a temp file and rename it over the session, so a crash leaves
+        # either the old or the new file, never a torn one
+        tmp_path = filepath.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(session_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+
+        # Everything logged so far is now in the session file
+        self._open_log(self.session_name, truncate=True)
+
+        index = self._read_index()
+        if index is not None:
+            index[self.session_name] = _index_entry(session_data, self.session_name, filepath.stat().st_mtime_ns)
+            self._write_index(index)
 
         return self.session_name
 
@@ -158,15 +332,24 @@ class SessionManager:
             return False
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
+                saved_mtime_ns = os.fstat(f.fileno()).st_mtime_ns
 
             self.session_name = data.get("session_name", name)
             self.metadata = data.get("metadata", {})
             self.messages = [
-                Message(role=m["role"], content=m["content"])
+                Message(role=m["role"], content=m["content"], metadata=m.get("metadata"))
                 for m in data.get("messages", [])
             ]
+            # Messages added after the last save of this session
+            self._close_log()
+            self.messages.extend(
+                Message(role=m["role"], content=m["content"], metadata=m.get("metadata"))
+                for m in self._read_log(name, saved_mtime_ns)
+            )
+            self._messages_dicts = [_message_to_dict(m) for m in self.messages]
+            self.metadata["message_count"] = len(self.messages)
 
             usage_data = data.get("usage", {})
             self.usage = UsageStats(
@@ -176,6 +359,7 @@ class SessionManager:
                 estimated_cost=usage_data.get("estimated_cost", 0.0)
             )
 
+            self._open_log(name, truncate=False)
             return True
 
         except Exception:
@@ -187,25 +371,95 @@ class SessionManager:
         Returns:
             List of SessionInfo objects
         """
-        sessions = []
-
-        for filepath in sorted(self.sessions_dir.glob("*.json"), reverse=True):
+        if self._log is not None:
+            try:
+                self._flush_log()
+            except OSError:
+                self._close_log()
+
+        index = self._read_index() or {}
+        changed = False
+        session_files = {}
+        log_mtimes = {}
+
+        with os.scandir(self.sessions_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".json") and name != INDEX_FILENAME:
+                    session_files[name[:-5]] = entry
+                elif name.endswith(LOG_SUFFIX):
+                    try:
+                        log_mtimes[name[:-len(LOG_SUFFIX)]] = entry.stat().st_mtime_ns
+                    except OSError:
+                        pass
+
+        # Only session files and logs that are new or modified since they were
+        # indexed (e.g. written by another process) are read
+        present = set(session_files)
+        for stem, entry in session_files.items():
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                metadata = data.get("metadata", {})
-                sessions.append(SessionInfo(
-                    name=data.get("session_name", filepath.stem),
-                    created_at=metadata.get("created_at", ""),
-                    provider=metadata.get("provider", "unknown"),
-                    model=metadata.get("model", "unknown"),
-                    message_count=len(data.get("messages", []))
-                ))
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = index.get(stem)
+                if cached is None or cached.get("mtime_ns") != mtime_ns:
+                    with open(entry.path, 'rb') as f:
+                        data = _loads(f.read())
+                    cached = index[stem] = _index_entry(data, stem, mtime_ns)
+                    changed = True
+                log_mtime_ns = log_mtimes.get(stem)
+                if cached.get("log_mtime_ns") != log_mtime_ns:
+                    logged = self._read_log(stem, mtime_ns) if log_mtime_ns is not None else []
+                    cached["logged"] = len(logged)
+                    cached["log_mtime_ns"] = log_mtime_ns
+                    changed = True
             except Exception:
-                continue
+                index.pop(stem, None)
+                present.discard(stem)
+                changed = True
+
+        for stem in index.keys() - present:
+            del index[stem]
+            changed = True
+
+        if changed:
+            self._write_index(index)
+
+        return [
+            SessionInfo(
+                name=row["name"],
+                created_at=row["created_at"],
+                provider=row["provider"],
+                model=row["model"],
+                message_count=row["message_count"] + row.get("logged", 0)
+            )
+            for _, row in sorted(index.items(), reverse=True)
+        ]
+
+    def _read_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read the session index.
+
+        Returns:
+            Index rows keyed by file stem, or None if missing or unreadable
+        """
+        try:
+            with open(self._index_path, 'rb') as f:
+                index = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return index if isinstance(index, dict) else None
 
-        return sessions
+    def _write_index(self, index: Dict[str, Dict[str, Any]]):
+        """Atomically replace the session index.
+
+        Args:
+            index: Index rows keyed by file stem
+        """
+        tmp_path = self._index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(index))
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            pass  # The index is only a cache; list_sessions() rebuilds it
 
     def export(self, filename: Optional[str] = None) -> Path:
         """Export conversation to a markdown file.
@@ -216,39 +470,46 @@ class SessionManager:
         Returns:
             Path to exported file
         """
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"conversation_{timestamp}.md"
+            filename = f"conversation_{now.strftime('%Y%m%d_%H%M%S')}.md"
 
         filepath = self.exports_dir / filename
 
         # Build markdown content
-        content = f"# Conversation Export\n\n"
-        content += f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        content += f"**Session:** {self.session_name}\n"
+        parts = [
+            "# Conversation Export\n\n",
+            f"**Exported:** {now.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Session:** {self.session_name}\n",
+        ]
         if self.metadata.get("model"):
-            content += f"**Model:** {self.metadata['model']}\n"
-        content += f"**Messages:** {len(self.messages)}\n\n"
+            parts.append(f"**Model:** {self.metadata['model']}\n")
+        parts.append(f"**Messages:** {len(self.messages)}\n\n")
 
         # Add usage stats
         usage = self.get_usage()
-        content += f"## Usage Statistics\n\n"
-        content += f"- Total Tokens: {usage['total_tokens']:,}\n"
-        content += f"- Prompt Tokens: {usage['prompt_tokens']:,}\n"
-        content += f"- Completion Tokens: {usage['completion_tokens']:,}\n"
-        content += f"- Estimated Cost: ${usage['estimated_cost']:.4f}\n\n"
-
-        content += "---\n\n"
+        parts.append(
+            "## Usage Statistics\n\n"
+            f"- Total Tokens: {usage['total_tokens']:,}\n"
+            f"- Prompt Tokens: {usage['prompt_tokens']:,}\n"
+            f"- Completion Tokens: {usage['completion_tokens']:,}\n"
+            f"- Estimated Cost: ${usage['estimated_cost']:.4f}\n\n"
+            "---\n\n"
+        )
 
         # Add conversation
-        content += "## Conversation\n\n"
-        for msg in self.messages:
-            role = msg.role.capitalize()
-            content += f"### {role}\n\n{msg.content}\n\n"
-
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        parts.append("## Conversation\n\n")
+        for msg in self._messages_dicts:
+            role = msg["role"].capitalize()
+            tool_call = msg["metadata"].get("tool_call") if "metadata" in msg else None
+            if tool_call:
+                # Tool calls are stored compactly; pretty-print them for readers
+                text = f"I'll use the {tool_call['tool']} tool.\n```json\n{json.dumps(tool_call, indent=2)}\n```"
+            else:
+                text = msg["content"]
+            parts.append(f"### {role}\n\n{text}\n\n")
+
+        filepath.write_text("".join(parts), encoding='utf-8')
 
         return filepath
 
@@ -264,6 +525,12 @@ class SessionManager:
         filepath = self.sessions_dir / f"{name}.json"
 
         if filepath.exists():
+            if name == self._log_name:
+                self._close_log()
             filepath.unlink()
+            self._log_path(name).unlink(missing_ok=True)
+            index = self._read_index()
+            if index is not None and index.pop(name, None) is not None:
+                self._write_index(index)
             return True
         return False
@@ -4,6 +4,8 @@ Base tool abstract class.
 All tools must implement this interface.
 """
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, List
 
@@ -84,7 +86,8 @@ class FunctionTool(BaseTool):
         parameters: Dict[str, Any],
         handler: callable,
         provider_specific: Optional[List[str]] = None,
-        provider_excluded: Optional[List[str]] = None
+        provider_excluded: Optional[List[str]] = None,
+        blocking: bool = True
     ):
         """Create a tool from a function.
 
@@ -95,11 +98,16 @@ class FunctionTool(BaseTool):
             handler: Function to execute (can be sync or async)
             provider_specific: Only for these providers
             provider_excluded: Excluded for these providers
+            blocking: Run a sync handler in a worker thread so it doesn't stall
+                the event loop; pass False for quick, CPU-only handlers
         """
         self.name = name
         self.description = description
         self.parameters = parameters
         self._handler = handler
+        # Resolved once; execute() runs for every tool call
+        self._is_coro = inspect.iscoroutinefunction(handler)
+        self._blocking = blocking and not self._is_coro
         self.provider_specific = provider_specific
         self.provider_excluded = provider_excluded
 
@@ -112,13 +120,12 @@ class FunctionTool(BaseTool):
         Returns:
             String result
         """
-        import asyncio
-        import inspect
-
         # Handle both sync and async functions
-        if inspect.iscoroutinefunction(self._handler):
+        if self._is_coro:
             result = await self._handler(**kwargs)
+        elif self._blocking:
+            result = await asyncio.to_thread(self._handler, **kwargs)
         else:
             result = self._handler(**kwargs)
 
-        return str(result)
+        return result if isinstance(result, str) else str(result)
@@ -4,11 +4,38 @@ Built-in tools for the ppxai engine.
 These tools are registered automatically when the engine starts.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
+    from ..base import BaseTool
     from ..manager import ToolManager
 
+# Built tool instances per provider. The tools are stateless wrappers around
+# module-level functions, so managers can share them.
+_BUILTIN_TOOLS_CACHE: Dict[Optional[str], Tuple['BaseTool', ...]] = {}
+
+
+def _build_builtin_tools(provider: Optional[str]) -> Tuple['BaseTool', ...]:
+    """Instantiate the built-in tools for a provider.
+
+    Args:
+        provider: Provider name passed through to the tool modules
+
+    Returns:
+        Tools in registration order
+    """
+    from ..manager import ToolManager
+    from . import filesystem, shell, calculator, datetime_tool, web
+
+    # Register tools from each module
+    scratch = ToolManager()
+    filesystem.register_tools(scratch)
+    shell.register_tools(scratch)
+    calculator.register_tools(scratch)
+    datetime_tool.register_tools(scratch)
+    web.register_tools(scratch, provider)
+    return tuple(scratch.get_available_tools())
+
 
 def register_all_builtin_tools(manager: 'ToolManager', provider: str = None):
     """Register all built-in tools with the manager.
@@ -17,11 +44,8 @@ def register_all_builtin_tools(manager: 'ToolManager', provider: str = None):
         manager: ToolManager instance
         provider: Current provider name (for capability-based filtering)
     """
-    from . import filesystem, shell, calculator, datetime_tool, web
-
-    # Register tools from each module
-    filesystem.register_tools(manager)
-    shell.register_tools(manager)
-    calculator.register_tools(manager)
-    datetime_tool.register_tools(manager)
-    web.register_tools(manager, provider)
+    tools = _BUILTIN_TOOLS_CACHE.get(provider)
+    if tools is None:
+        tools = _BUILTIN_TOOLS_CACHE[provider] = _build_builtin_tools(provider)
+    for tool in tools:
+        manager.register_tool(tool)
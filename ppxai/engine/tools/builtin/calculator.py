@@ -2,12 +2,37 @@
 Calculator tool for mathematical expressions.
 """
 
+import ast
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..manager import ToolManager
 
 
+# Deletes every allowed character; anything left over is invalid
+_STRIP_ALLOWED = str.maketrans('', '', '0123456789+-*/(). ')
+
+# Arithmetic on numeric literals; anything else is rejected before compiling
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub,
+)
+
+
+@lru_cache(maxsize=512)
+def _compile(expression: str):
+    """Parse, validate and compile an arithmetic expression."""
+    tree = ast.parse(expression.strip(), mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            raise ValueError("only numbers are allowed")
+    return compile(tree, '<calculator>', 'eval')
+
+
 def calculate(expression: str) -> str:
     """Safely evaluate a mathematical expression.
 
@@ -18,10 +43,9 @@ def calculate(expression: str) -> str:
         Result or error message
     """
     try:
-        allowed_chars = set('0123456789+-*/(). ')
-        if not all(c in allowed_chars for c in expression):
+        if expression.translate(_STRIP_ALLOWED):
             return "Error: Invalid characters in expression"
-        result = eval(expression, {"__builtins__": {}}, {})
+        result = eval(_compile(expression), {"__builtins__": {}}, {})
         return str(result)
     except Exception as e:
         return f"Error calculating: {str(e)}"
@@ -40,5 +64,6 @@ def register_tools(manager: 'ToolManager'):
             },
             "required": ["expression"]
         },
-        handler=calculate
+        handler=calculate,
+        blocking=False
     )
@@ -2,8 +2,9 @@
 Date and time tool with timezone support.
 """
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 import time
 
 if TYPE_CHECKING:
@@ -51,6 +52,21 @@ def get_system_timezone() -> str:
         return "UTC"
 
 
+@lru_cache(maxsize=64)
+def _get_tzinfo(name: str) -> Optional[tzinfo]:
+    """Resolve an IANA timezone name, or None if it is unknown."""
+    try:
+        import zoneinfo
+        return zoneinfo.ZoneInfo(name)
+    except Exception:
+        # Fallback for older Python or invalid timezone
+        try:
+            import pytz
+            return pytz.timezone(name)
+        except Exception:
+            return None
+
+
 def get_datetime(timezone: str = "") -> str:
     """Get current date and time with timezone support.
 
@@ -75,16 +91,9 @@ def get_datetime(timezone: str = "") -> str:
             now = datetime.now().astimezone()
             tz_display = timezone
         else:
-            try:
-                import zoneinfo
-                tz = zoneinfo.ZoneInfo(timezone)
-            except Exception:
-                # Fallback for older Python or invalid timezone
-                try:
-                    import pytz
-                    tz = pytz.timezone(timezone)
-                except Exception:
-                    return f"Error: Invalid timezone '{timezone}'. Use IANA format like 'Europe/Zurich', 'America/New_York', 'UTC'"
+            tz = _get_tzinfo(timezone)
+            if tz is None:
+                return f"Error: Invalid timezone '{timezone}'. Use IANA format like 'Europe/Zurich', 'America/New_York', 'UTC'"
             now = datetime.now(tz)
             tz_display = timezone
 
@@ -116,5 +125,6 @@ def register_tools(manager: 'ToolManager'):
             },
             "required": []
         },
-        handler=get_datetime
+        handler=get_datetime,
+        blocking=False
     )
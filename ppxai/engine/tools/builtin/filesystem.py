@@ -2,14 +2,82 @@
 Filesystem tools: read_file, search_files, list_directory.
 """
 
+import fnmatch
 import glob as glob_module
+import heapq
+import os
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from ..manager import ToolManager
 
 
+SEARCH_MAX_RESULTS = 50
+LIST_MAX_ITEMS = 100
+
+
+@lru_cache(maxsize=256)
+def _owner_name(uid: int) -> str:
+    """User name for a uid, or the number if it can't be resolved."""
+    try:
+        import pwd
+        return pwd.getpwuid(uid).pw_name
+    except Exception:
+        return str(uid)
+
+
+@lru_cache(maxsize=256)
+def _group_name(gid: int) -> str:
+    """Group name for a gid, or the number if it can't be resolved."""
+    try:
+        import grp
+        return grp.getgrgid(gid).gr_name
+    except Exception:
+        return str(gid)
+
+
+def _iter_matches(directory: str, pattern: str, _ancestors: frozenset = frozenset()) -> Iterator[str]:
+    """Lazily yield paths under directory whose name matches pattern.
+
+    Walks like glob's '**': hidden entries are skipped unless the pattern itself
+    starts with '.', and symlinked directories are followed. A directory that is
+    already one of its own ancestors is not entered again, so symlink loops end.
+    """
+    try:
+        st = os.stat(directory)
+    except OSError:
+        return
+    key = (st.st_dev, st.st_ino)
+    if key in _ancestors:
+        return
+    _ancestors = _ancestors | {key}
+
+    match_hidden = pattern.startswith('.')
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return
+    subdirs = []
+    with it:
+        for entry in it:
+            name = entry.name
+            hidden = name.startswith('.')
+            if fnmatch.fnmatch(name, pattern) and (match_hidden or not hidden):
+                yield entry.path
+            if hidden:
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        yield from _iter_matches(subdir, pattern, _ancestors)
+
 def search_files(pattern: str, directory: str = ".") -> str:
     """Search for files matching a pattern.
 
@@ -21,12 +89,20 @@ def search_files(pattern: str, directory: str = ".") -> str:
         Newline-separated list of matching files
     """
     try:
-        results = glob_module.glob(f"{directory}/**/{pattern}", recursive=True)
+        if not os.path.isdir(directory):
+            return f"No files found matching '{pattern}'"
+        if '/' in pattern or os.sep in pattern:
+            # Patterns spanning directories still go through glob, lazily
+            matches = glob_module.iglob(f"{directory}/**/{pattern}", recursive=True)
+        else:
+            matches = _iter_matches(directory, pattern)
+        # One extra result tells us whether the listing was cut short
+        results = list(islice(matches, SEARCH_MAX_RESULTS + 1))
         if not results:
             return f"No files found matching '{pattern}'"
-        output = "\n".join(results[:50])
-        if len(results) > 50:
-            output += f"\n... ({len(results) - 50} more files)"
+        output = "\n".join(results[:SEARCH_MAX_RESULTS])
+        if len(results) > SEARCH_MAX_RESULTS:
+            output += "\n... (more files, narrow the pattern)"
         return output
     except Exception as e:
         return f"Error: {str(e)}"
@@ -49,11 +125,12 @@ def read_file(filepath: str, max_lines: int = 1000) -> str:
         if not path.is_file():
             return f"Error: Not a file: {filepath}"
 
+        # Read one line past the limit to tell whether anything was cut
         with open(path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[:max_lines]
-            content = ''.join(lines)
+            lines = list(islice(f, max_lines + 1))
 
-        if len(lines) == max_lines:
+        content = ''.join(lines[:max_lines])
+        if len(lines) > max_lines:
             content += f"\n... (truncated to {max_lines} lines)"
 
         return content
@@ -83,25 +160,22 @@ def list_directory(path: str = ".", format: str = "simple") -> str:
 
         items = []
 
+        # Listing a dirent is cheap; only the first LIST_MAX_ITEMS names are
+        # sorted and stat'ed
+        with os.scandir(dir_path) as it:
+            all_entries = list(it)
+        total = len(all_entries)
+        entries = heapq.nsmallest(LIST_MAX_ITEMS, all_entries, key=lambda e: e.name)
+
         if format == "long":
-            for item in sorted(dir_path.iterdir()):
+            for item in entries:
                 try:
                     stats = item.stat()
                     mode = stats.st_mode
                     perms = stat.filemode(mode)
                     nlink = stats.st_nlink
-
-                    try:
-                        import pwd
-                        owner = pwd.getpwuid(stats.st_uid).pw_name
-                    except Exception:
-                        owner = str(stats.st_uid)
-
-                    try:
-                        import grp
-                        group = grp.getgrgid(stats.st_gid).gr_name
-                    except Exception:
-                        group = str(stats.st_gid)
+                    owner = _owner_name(stats.st_uid)
+                    group = _group_name(stats.st_gid)
 
                     size = stats.st_size
                     mtime = datetime.fromtimestamp(stats.st_mtime)
@@ -112,13 +186,13 @@ def list_directory(path: str = ".", format: str = "simple") -> str:
                 except Exception as e:
                     items.append(f"? {item.name} (error: {e})")
         else:
-            for item in sorted(dir_path.iterdir()):
+            for item in entries:
                 item_type = "DIR " if item.is_dir() else "FILE"
                 items.append(f"{item_type} {item.name}")
 
-        result = "\n".join(items[:100])
-        if len(items) > 100:
-            result += f"\n... ({len(items) - 100} more items)"
+        result = "\n".join(items)
+        if total > LIST_MAX_ITEMS:
+            result += f"\n... ({total - LIST_MAX_ITEMS} more items)"
 
         return result
     except Exception as e:
@@ -4,7 +4,7 @@ Tool manager for the ppxai engine.
 Handles tool registration, filtering by provider, and execution.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any
 from .base import BaseTool, FunctionTool
 from ..types import Event, EventType, ToolCallInfo
 
@@ -18,7 +18,13 @@ class ToolManager:
     def __init__(self):
         """Initialize the tool manager."""
         self._tools: Dict[str, BaseTool] = {}
+        # Parameter names per tool, computed once at registration
+        self._expected_params: Dict[str, FrozenSet[str]] = {}
         self._provider: Optional[str] = None
+        # Derived views of the available tools; reset whenever the tool set or provider changes
+        self._available: Optional[List[BaseTool]] = None
+        self._tool_infos: Optional[List[Dict[str, Any]]] = None
+        self._tools_prompt: Optional[str] = None
         self.max_iterations: int = 15
 
     def register_tool(self, tool: BaseTool):
@@ -28,6 +34,8 @@ class ToolManager:
             tool: Tool instance to register
         """
         self._tools[tool.name] = tool
+        self._reset_caches()
+        self._expected_params[tool.name] = frozenset(tool.parameters.get("properties", {}))
 
     def register_function(
         self,
@@ -36,7 +44,8 @@ class ToolManager:
         parameters: Dict[str, Any],
         handler: callable,
         provider_specific: Optional[List[str]] = None,
-        provider_excluded: Optional[List[str]] = None
+        provider_excluded: Optional[List[str]] = None,
+        blocking: bool = True
     ):
         """Register a function as a tool.
 
@@ -47,6 +56,7 @@ class ToolManager:
             handler: Function to execute
             provider_specific: Only for these providers
             provider_excluded: Excluded for these providers
+            blocking: Run a sync handler in a worker thread (see FunctionTool)
         """
         tool = FunctionTool(
             name=name,
@@ -54,7 +64,8 @@ class ToolManager:
             parameters=parameters,
             handler=handler,
             provider_specific=provider_specific,
-            provider_excluded=provider_excluded
+            provider_excluded=provider_excluded,
+            blocking=blocking
         )
         self.register_tool(tool)
 
@@ -65,6 +76,7 @@ class ToolManager:
             provider: Provider name
         """
         self._provider = provider
+        self._reset_caches()
 
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Get a specific tool by name.
@@ -82,15 +94,38 @@ class ToolManager:
             return None
         return tool
 
+    def get_expected_params(self, name: str) -> FrozenSet[str]:
+        """Get the parameter names declared by a registered tool.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Frozen set of parameter names (empty if the tool is unknown)
+        """
+        return self._expected_params.get(name, frozenset())
+
     def get_available_tools(self) -> List[BaseTool]:
         """Get tools available for current provider.
 
         Returns:
             List of available tools
         """
-        if self._provider is None:
-            return list(self._tools.values())
-        return [t for t in self._tools.values() if t.is_available_for(self._provider)]
+        return list(self._available_tools())
+
+    def _available_tools(self) -> List[BaseTool]:
+        """Cached list of tools available for the current provider (do not mutate)."""
+        if self._available is None:
+            if self._provider is None:
+                self._available = list(self._tools.values())
+            else:
+                self._available = [t for t in self._tools.values() if t.is_available_for(self._provider)]
+        return self._available
+
+    @property
+    def tool_count(self) -> int:
+        """Number of tools available for the current provider."""
+        return len(self._available_tools())
 
     def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools as dictionaries.
@@ -98,10 +133,12 @@ class ToolManager:
         Returns:
             List of tool info dicts with name and description
         """
-        return [
-            {"name": t.name, "description": t.description}
-            for t in self.get_available_tools()
-        ]
+        if self._tool_infos is None:
+            self._tool_infos = [
+                {"name": t.name, "description": t.description}
+                for t in self._available_tools()
+            ]
+        return list(self._tool_infos)
 
     async def execute_tool(self, name: str, **kwargs) -> str:
         """Execute a tool by name.
@@ -124,10 +161,19 @@ class ToolManager:
     def get_tools_prompt(self) -> str:
         """Generate system prompt describing available tools.
 
+        The prompt is cached until tools are registered or cleared, or the
+        provider changes.
+
         Returns:
             System prompt text for tool usage
         """
-        tools = self.get_available_tools()
+        if self._tools_prompt is None:
+            self._tools_prompt = self._build_tools_prompt()
+        return self._tools_prompt
+
+    def _build_tools_prompt(self) -> str:
+        """Build the tools system prompt for the currently available tools."""
+        tools = self._available_tools()
         if not tools:
             return ""
 
@@ -195,6 +241,14 @@ class ToolManager:
     def clear(self):
         """Remove all registered tools."""
         self._tools.clear()
+        self._expected_params.clear()
+        self._reset_caches()
+
+    def _reset_caches(self):
+        """Drop the cached tool views after the tool set or provider changes."""
+        self._available = None
+        self._tool_infos = None
+        self._tools_prompt = None
 
     async def cleanup(self):
         """Clean up resources (for MCP tools, etc)."""
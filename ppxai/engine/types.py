@@ -34,14 +34,15 @@ class Event:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A conversation message."""
     role: str  # 'user', 'assistant', 'system'
     content: str
+    metadata: Optional[Dict[str, Any]] = None  # e.g. {"tool_call": {...}}
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageStats:
     """Token usage and cost statistics."""
     prompt_tokens: int = 0
@@ -49,6 +50,14 @@ class UsageStats:
     total_tokens: int = 0
     estimated_cost: float = 0.0
 
+    def __iadd__(self, other: "UsageStats") -> "UsageStats":
+        """Accumulate another request's usage into this one."""
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.total_tokens += other.total_tokens
+        self.estimated_cost += other.estimated_cost
+        return self
+
 
 @dataclass
 class ChatResponse:
@@ -58,7 +67,7 @@ class ChatResponse:
     usage: Optional[UsageStats] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderCapabilities:
     """Capabilities that a provider has natively (no tool needed)."""
     web_search: bool = False
@@ -67,6 +76,17 @@ class ProviderCapabilities:
     citations: bool = False
     streaming: bool = True
 
+    def needs(self, tool_category: str) -> bool:
+        """Check if a tool is needed for a category (no native capability).
+
+        Args:
+            tool_category: Category like 'web_search', 'weather', etc.
+
+        Returns:
+            True if the capability is missing or unknown
+        """
+        return not getattr(self, tool_category, False)
+
     @classmethod
     def from_dict(cls, data: Dict[str, bool]) -> 'ProviderCapabilities':
         """Create from dictionary."""
@@ -4,7 +4,6 @@ Main entry point for the ppxai application.
 
 import os
 import sys
-import asyncio
 from pathlib import Path
 
 from prompt_toolkit import PromptSession
@@ -219,8 +218,8 @@ def main():
 
             # Send message to API
             if tools_enabled:
-                # Use async tool-enabled chat
-                response = asyncio.run(client.chat_with_tools(augmented_input, current_model))
+                # Use async tool-enabled chat on the loop the tools were initialized on
+                response = handler.run_async(client.chat_with_tools(augmented_input, current_model))
             else:
                 # Use regular chat
                 response = client.chat(augmented_input, current_model, stream=True)
@@ -241,6 +240,7 @@ def main():
             continue
 
         except EOFError:
+            handler.close_loop()
             console.print("\n[yellow]Goodbye![/yellow]")
             break
 
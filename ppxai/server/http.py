@@ -497,6 +497,8 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on server shutdown."""
     global engine
+    if engine is not None:
+        await engine.cleanup()
     engine = None
     print("ppxai HTTP server stopped")
 
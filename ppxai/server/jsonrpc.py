@@ -417,6 +417,14 @@ class JsonRpcServer:
         # Signal ready
         print(json.dumps({"type": "ready"}), flush=True)
 
+        try:
+            self._serve()
+        finally:
+            # stdin closed: release tools, session files and the chat loop
+            self.engine.close()
+
+    def _serve(self):
+        """Handle requests until stdin is closed."""
         for line in sys.stdin:
             line = line.strip()
             if not line:
@@ -98,6 +98,39 @@ class TestPerplexityClientSessions:
         assert sessions[0]["name"] == "test-session"
         assert sessions[0]["message_count"] == 1
 
+    def test_list_sessions_skips_only_engine_index(self, temp_sessions_dir, monkeypatch):
+        """Test that the engine's index is hidden but sessions named with '_' are not."""
+        monkeypatch.setattr('ppxai.client.SESSIONS_DIR', temp_sessions_dir)
+        (temp_sessions_dir / "_index.json").write_text(json.dumps({"a": {"name": "a"}}))
+        (temp_sessions_dir / "_draft.json").write_text(json.dumps({
+            "session_name": "_draft",
+            "metadata": {},
+            "conversation_history": [],
+        }))
+
+        sessions = PerplexityClient.list_sessions()
+        assert [s["name"] for s in sessions] == ["_draft"]
+
+    def test_list_sessions_reuses_listing_until_save(self, temp_sessions_dir, monkeypatch):
+        """Test that the listing is cached and refreshed after save_session."""
+        monkeypatch.setattr('ppxai.client.SESSIONS_DIR', temp_sessions_dir)
+        with patch('ppxai.client.OpenAI'):
+            client = PerplexityClient("test-api-key")
+        client.session_name = "cached-session"
+        client.save_session()
+
+        with patch('ppxai.client.json.load', wraps=json.load) as mock_load:
+            first = PerplexityClient.list_sessions()
+            second = PerplexityClient.list_sessions()
+        assert first == second
+        assert mock_load.call_count == 1
+        assert first[0]["message_count"] == 0
+
+        # Overwriting the same file leaves the directory mtime alone
+        client.conversation_history.append({"role": "user", "content": "hi"})
+        client.save_session()
+        assert PerplexityClient.list_sessions()[0]["message_count"] == 1
+
 
 class TestPerplexityClientUsageTracking:
     """Tests for usage tracking."""
@@ -184,7 +217,7 @@ class TestAIClientMultiProvider:
     def test_openai_client_initialized_with_custom_url(self):
         """Test that OpenAI client is initialized with custom base URL."""
         # Temporarily override SSL_VERIFY to ensure consistent test behavior
-        with patch.dict('os.environ', {"SSL_VERIFY": "true"}):
+        with patch.dict('os.environ', {"SSL_VERIFY": "true"}), patch.dict('ppxai.config._ENV_CACHE', clear=True):
             with patch('ppxai.client.OpenAI') as mock_openai:
                 AIClient(
                     "test-key",
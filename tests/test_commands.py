@@ -7,7 +7,7 @@ import os
 from unittest.mock import Mock, patch, MagicMock, call
 from io import StringIO
 
-from ppxai.commands import CommandHandler, send_coding_task
+from ppxai.commands import CommandHandler, send_coding_task, _iter_files
 from ppxai.client import AIClient
 
 
@@ -86,6 +86,21 @@ class TestCommandHandlerBothProviders:
         assert result is True
         mock_client_custom.save_session.assert_called_once()
 
+    def test_run_async_reuses_loop_until_quit(self, handler_perplexity, mock_client_perplexity):
+        """Test that coroutines share one event loop, closed by /quit."""
+        import asyncio
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = handler_perplexity.run_async(current_loop())
+        second = handler_perplexity.run_async(current_loop())
+        assert first is second
+
+        mock_client_perplexity.conversation_history = []
+        handler_perplexity.handle_quit()
+        assert first.is_closed()
+
     def test_quit_with_empty_history_perplexity(self, handler_perplexity, mock_client_perplexity):
         """Test /quit with empty history for Perplexity."""
         mock_client_perplexity.conversation_history = []
@@ -284,7 +299,7 @@ class TestCommandHandlerBothProviders:
     @patch('ppxai.commands.get_api_key')
     @patch('ppxai.commands.get_base_url')
     @patch('ppxai.commands.get_provider_config')
-    @patch('ppxai.client.AIClient')
+    @patch('ppxai.commands.AIClient')
     def test_provider_switch_perplexity_to_custom(
         self,
         mock_aiclient_class,
@@ -323,7 +338,7 @@ class TestCommandHandlerBothProviders:
     @patch('ppxai.commands.get_api_key')
     @patch('ppxai.commands.get_base_url')
     @patch('ppxai.commands.get_provider_config')
-    @patch('ppxai.client.AIClient')
+    @patch('ppxai.commands.AIClient')
     def test_provider_switch_custom_to_perplexity(
         self,
         mock_aiclient_class,
@@ -595,7 +610,7 @@ class TestToolsCommands:
         """Test /tools status when disabled for custom provider."""
         handler_custom.handle_tools("status")
 
-    @patch('ppxai.commands.asyncio.run')
+    @patch('ppxai.commands.CommandHandler.run_async')
     def test_tools_enable_perplexity(self, mock_asyncio, handler_perplexity):
         """Test /tools enable for Perplexity."""
         # Create a proper mock class that can be used with isinstance
@@ -613,7 +628,7 @@ class TestToolsCommands:
         # Should create tool client
         assert isinstance(handler_perplexity.client, MockToolClient)
 
-    @patch('ppxai.commands.asyncio.run')
+    @patch('ppxai.commands.CommandHandler.run_async')
     def test_tools_enable_custom(self, mock_asyncio, handler_custom):
         """Test /tools enable for custom provider."""
         # Create a proper mock class that can be used with isinstance
@@ -826,6 +841,27 @@ class TestCommandHandlerIntegration:
         result = handler_custom.handle_command("/exit")
         assert result is True
 
+    def test_handle_command_passes_args(self, handler_perplexity):
+        """Test the command word is case-insensitive and args are passed through."""
+        with patch.object(handler_perplexity, '_dispatch', {"/show": Mock()}) as table:
+            assert handler_perplexity.handle_command("/SHOW   docs/README.md") is False
+            table["/show"].assert_called_once_with("docs/README.md")
+
+    @pytest.mark.parametrize("user_input", ["/show\tREADME.md", "/show\nREADME.md"])
+    def test_handle_command_splits_on_any_whitespace(self, handler_perplexity, user_input):
+        """Test tabs and newlines separate the command from its args."""
+        with patch.object(handler_perplexity, '_dispatch', {"/show": Mock()}) as table:
+            assert handler_perplexity.handle_command(user_input) is False
+            table["/show"].assert_called_once_with("README.md")
+
+    def test_dispatch_tables_resolve(self, handler_perplexity):
+        """Test every dispatch table entry names an existing handler method."""
+        for method_name in CommandHandler._COMMANDS.values():
+            assert callable(getattr(handler_perplexity, method_name))
+        for method_name, _ in CommandHandler._TOOLS_SUBCOMMANDS.values():
+            assert callable(getattr(handler_perplexity, method_name))
+        assert handler_perplexity._dispatch["/cat"] == handler_perplexity.handle_show
+
     @patch('ppxai.commands.display_welcome')
     def test_handle_help_command_perplexity(self, mock_welcome, handler_perplexity):
         """Test /help command for Perplexity."""
@@ -839,3 +875,146 @@ class TestCommandHandlerIntegration:
         result = handler_custom.handle_command("/help")
         assert result is False
         mock_welcome.assert_called_once()
+
+
+class TestFileSearch:
+    """Test @file search and resolution helpers."""
+
+    @pytest.fixture
+    def handler(self, tmp_path, monkeypatch):
+        """Handler rooted in a small temporary project tree."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app_config.py").write_text("CONFIG = 1\n")
+        (tmp_path / "README.md").write_text("# Readme\n")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "app_config.py").write_text("ignored\n")
+        monkeypatch.chdir(tmp_path)
+
+        client = Mock(spec=AIClient)
+        client.conversation_history = []
+        client.session_metadata = {}
+        return CommandHandler(client, "test-key", "sonar-pro", "https://api.perplexity.ai", "perplexity")
+
+    def test_search_exact_filename(self, handler, tmp_path):
+        """Test exact filename match in a nested directory."""
+        assert handler._search_files("app_config.py") == [tmp_path / "src" / "app_config.py"]
+
+    def test_search_skips_ignored_dirs(self, handler, tmp_path):
+        """Test that ignored directories are never returned."""
+        matches = handler._search_files("app config")
+        assert matches == [tmp_path / "src" / "app_config.py"]
+
+    def test_search_no_match(self, handler):
+        """Test search with no matching files."""
+        assert handler._search_files("does_not_exist.txt") == []
+
+    def test_process_file_references(self, handler, tmp_path):
+        """Test @refs are replaced by filenames and file contents appended."""
+        message, files = handler.process_file_references("Compare @README.md with @missing.txt")
+        assert message.startswith("Compare README.md with @missing.txt")
+        assert "# Readme" in message
+        assert files == [{'name': 'README.md', 'path': str(tmp_path / "README.md")}]
+
+    def test_process_file_references_no_refs(self, handler):
+        """Test messages without @refs pass through unchanged."""
+        assert handler.process_file_references("plain question") == ("plain question", [])
+
+    def test_search_files_batch_single_walk(self, handler, tmp_path):
+        """Test several queries are resolved by one directory walk."""
+        with patch('ppxai.commands._iter_files', wraps=_iter_files) as mock_walk:
+            found = handler._search_files_batch(["README.md", "app_config.py", "nothing.txt"], max_results=1)
+        assert mock_walk.call_count == 1
+        assert found == {
+            "README.md": [tmp_path / "README.md"],
+            "app_config.py": [tmp_path / "src" / "app_config.py"],
+            "nothing.txt": [],
+        }
+
+    def test_process_file_references_skips_oversized(self, handler, tmp_path):
+        """Test files above MAX_REF_BYTES are not attached."""
+        from ppxai.commands import MAX_REF_BYTES
+        (tmp_path / "big.log").write_bytes(b"x" * (MAX_REF_BYTES + 1))
+        message, files = handler.process_file_references("See @big.log")
+        assert message == "See @big.log"
+        assert files == []
+
+    def test_process_file_references_attaches_empty_file(self, handler, tmp_path):
+        """Test an empty file is still attached."""
+        (tmp_path / "empty.txt").write_text("")
+        message, files = handler.process_file_references("See @empty.txt")
+        assert message.startswith("See empty.txt")
+        assert files == [{'name': 'empty.txt', 'path': str(tmp_path / "empty.txt")}]
+
+    @patch('ppxai.commands.console')
+    def test_show_direct_path(self, mock_console, handler):
+        """Test /show prints the header for a direct file path."""
+        handler.handle_show("README.md")
+        printed = " ".join(str(c.args[0]) for c in mock_console.print.call_args_list if c.args)
+        assert "README.md" in printed
+        assert "Not a file" not in printed
+
+    @patch('ppxai.commands.console')
+    def test_show_index_reuses_previous_matches(self, mock_console, handler, tmp_path):
+        """Test /show <number> picks from the last multiple-match listing."""
+        (tmp_path / "app_main.py").write_text("print('main')\n")
+        handler.handle_show("app")
+        assert len(handler._last_show_matches) == 2
+
+        mock_console.reset_mock()
+        with patch('ppxai.commands._iter_files') as mock_walk:
+            handler.handle_show("2")
+        mock_walk.assert_not_called()
+        printed = " ".join(str(c.args[0]) for c in mock_console.print.call_args_list if c.args)
+        assert handler._last_show_matches[1].name in printed
+        assert "No files found" not in printed
+
+    @patch('ppxai.commands.console')
+    def test_reference_then_show_decodes_once(self, mock_console, handler, tmp_path):
+        """Test an @reference and /show of the same unchanged file share one read."""
+        from ppxai.commands import _read_text_cached
+        _read_text_cached.cache_clear()
+        handler.process_file_references("Read @README.md")
+        handler.handle_show("README.md")
+        info = _read_text_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_process_file_references_many_refs_keeps_order(self, handler, tmp_path):
+        """Test files read in parallel are attached in reference order."""
+        for name in ("one.txt", "two.txt", "three.txt", "four.txt"):
+            (tmp_path / name).write_text(f"content of {name}")
+        message, files = handler.process_file_references(
+            "@four.txt @two.txt @one.txt @three.txt @missing.txt")
+        assert [f['name'] for f in files] == ["four.txt", "two.txt", "one.txt", "three.txt"]
+        assert message.index("content of four.txt") < message.index("content of three.txt")
+        assert "@missing.txt" in message
+
+    @patch('ppxai.commands.console')
+    def test_show_large_file_previews_head(self, mock_console, handler, tmp_path, monkeypatch):
+        """Test /show of a file over the size limit decodes only the preview."""
+        monkeypatch.setattr('ppxai.commands.SHOW_MAX_FULL_BYTES', 100)
+        monkeypatch.setattr('ppxai.commands.SHOW_PREVIEW_LINES', 5)
+        (tmp_path / "big.txt").write_text("".join(f"line {i}\n" for i in range(50)))
+        with patch('ppxai.commands.Syntax') as mock_syntax:
+            handler.handle_show("big.txt")
+        assert mock_syntax.call_args.args[0] == "".join(f"line {i}\n" for i in range(5))
+        printed = " ".join(str(c.args[0]) for c in mock_console.print.call_args_list if c.args)
+        assert "51 lines" in printed
+        assert "Showing first 5 of 51 lines" in printed
+
+    def test_search_single_and_multi_part_queries(self, handler, tmp_path):
+        """Test single-token queries match anywhere in the path and multi-part ones need every part."""
+        assert handler._search_files("config") == [tmp_path / "src" / "app_config.py"]
+        assert handler._search_files("src") == [tmp_path / "src" / "app_config.py"]
+        assert handler._search_files("src-config") == [tmp_path / "src" / "app_config.py"]
+        assert handler._search_files("src-readme") == []
+
+    def test_search_direct_path_skips_walk(self, handler, tmp_path):
+        """Test a query naming a file under cwd resolves without walking."""
+        with patch('ppxai.commands._iter_files') as mock_walk:
+            assert handler._search_files("src/app_config.py") == [tmp_path / "src" / "app_config.py"]
+            assert handler._search_files("README.md") == [tmp_path / "README.md"]
+        mock_walk.assert_not_called()
+
+    def test_search_glob_pattern(self, handler, tmp_path):
+        """Test wildcard queries are expanded as globs."""
+        assert handler._search_files("src/*.py") == [tmp_path / "src" / "app_config.py"]
@@ -3,6 +3,7 @@ import json
 import os
 import pytest
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import patch
 from ppxai.config import (
@@ -29,6 +30,9 @@ from ppxai.config import (
     provider_needs_tool,
     set_active_provider,
     reload_config,
+    refresh_api_keys,
+    cached_getenv,
+    invalidate_env_cache,
     validate_config,
     load_config,
     _find_config_file,
@@ -165,15 +169,24 @@ class TestProviderConfig:
     def test_get_active_models(self):
         """Test get_active_models returns models dict."""
         models = get_active_models()
-        assert isinstance(models, dict)
+        assert isinstance(models, Mapping)
         assert len(models) > 0
 
     def test_get_active_pricing(self):
         """Test get_active_pricing returns pricing dict."""
         pricing = get_active_pricing()
-        assert isinstance(pricing, dict)
+        assert isinstance(pricing, Mapping)
         assert len(pricing) > 0
 
+    def test_providers_are_read_only(self):
+        """Test PROVIDERS and the configs handed out by getters cannot be mutated."""
+        config = get_provider_config("perplexity")
+        assert config is PROVIDERS["perplexity"]
+        with pytest.raises(TypeError):
+            PROVIDERS["new"] = {}
+        with pytest.raises(TypeError):
+            config["models"]["1"]["id"] = "changed"
+
     def test_get_base_url_perplexity(self):
         """Test get_base_url for perplexity."""
         url = get_base_url("perplexity")
@@ -189,17 +202,50 @@ class TestProviderConfig:
         model = get_default_model("perplexity")
         assert model == "sonar-pro"
 
-    @patch.dict(os.environ, {"PERPLEXITY_API_KEY": "test-key-123"})
+    def test_getters_fall_back_to_perplexity(self):
+        """Test field getters fall back to perplexity for an unknown provider."""
+        assert get_base_url("nonexistent") == get_base_url("perplexity")
+        assert get_coding_model("nonexistent") == get_coding_model("perplexity")
+        assert get_default_model("nonexistent") == get_default_model("perplexity")
+        assert get_provider_capabilities("nonexistent") == get_provider_capabilities("perplexity")
+
     def test_get_api_key_perplexity(self):
         """Test get_api_key retrieves perplexity key from env."""
-        key = get_api_key("perplexity")
+        with patch.dict(os.environ, {"PERPLEXITY_API_KEY": "test-key-123"}):
+            refresh_api_keys()
+            key = get_api_key("perplexity")
+        refresh_api_keys()
         assert key == "test-key-123"
 
     def test_get_api_key_missing(self):
         """Test get_api_key returns empty string if not set."""
         with patch.dict(os.environ, {}, clear=True):
+            refresh_api_keys()
             key = get_api_key("perplexity")
-            assert key == ""
+        refresh_api_keys()
+        assert key == ""
+
+    def test_get_api_key_snapshot_until_refresh(self):
+        """Test env changes are picked up only after refresh_api_keys."""
+        with patch.dict(os.environ, {"PERPLEXITY_API_KEY": "old-key"}):
+            refresh_api_keys()
+            os.environ["PERPLEXITY_API_KEY"] = "new-key"
+            assert get_api_key("perplexity") == "old-key"
+            refresh_api_keys()
+            assert get_api_key("perplexity") == "new-key"
+        refresh_api_keys()
+
+    def test_cached_getenv_until_invalidated(self):
+        """Test cached_getenv keeps its first read until invalidate_env_cache."""
+        with patch.dict(os.environ, {"PPXAI_TEST_SETTING": "first"}):
+            invalidate_env_cache()
+            assert cached_getenv("PPXAI_TEST_SETTING") == "first"
+            os.environ["PPXAI_TEST_SETTING"] = "second"
+            assert cached_getenv("PPXAI_TEST_SETTING") == "first"
+            invalidate_env_cache()
+            assert cached_getenv("PPXAI_TEST_SETTING") == "second"
+        invalidate_env_cache()
+        assert cached_getenv("PPXAI_TEST_SETTING", "unset") == "unset"
 
 
 class TestProviderCapabilities:
@@ -215,6 +261,17 @@ class TestProviderCapabilities:
         """Test Perplexity doesn't need web search tool."""
         assert provider_needs_tool("perplexity", "web_search") is False
 
+    def test_provider_capabilities_are_read_only(self):
+        """Test capabilities cannot be mutated through the getter."""
+        caps = get_provider_capabilities("perplexity")
+        with pytest.raises(TypeError):
+            caps["web_search"] = False
+        assert provider_needs_tool("perplexity", "web_search") is False
+
+    def test_provider_needs_tool_unknown_provider_falls_back(self):
+        """Test unknown providers use perplexity's capabilities."""
+        assert provider_needs_tool("nonexistent", "web_search") is False
+
     def test_provider_needs_tool_unknown_category(self):
         """Test unknown capability defaults to needing tool."""
         assert provider_needs_tool("perplexity", "unknown_capability") is True
@@ -306,6 +363,20 @@ class TestConfigLoading:
                 assert found == Path(f.name)
         os.unlink(f.name)
 
+    def test_find_config_file_cached_until_reload(self):
+        """Test the config search result is reused until reload_config."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write("{}")
+        try:
+            with patch.dict(os.environ, {"PPXAI_CONFIG_FILE": f.name}):
+                assert _find_config_file() == Path(f.name)
+                with patch('ppxai.config.Path.is_file') as mock_is_file:
+                    assert _find_config_file() == Path(f.name)
+                mock_is_file.assert_not_called()
+        finally:
+            os.unlink(f.name)
+            reload_config()
+
     def test_find_config_file_nonexistent_env(self):
         """Test nonexistent PPXAI_CONFIG_FILE is ignored."""
         with patch.dict(os.environ, {"PPXAI_CONFIG_FILE": "/nonexistent/path.json"}):
@@ -463,6 +534,36 @@ class TestJSONConfigIntegration:
 
         os.unlink(f.name)
 
+    def test_load_config_reuses_unchanged_file(self):
+        """Test an unchanged config file is parsed once until reload_config."""
+        config_data = {
+            "providers": {
+                "minimal": {
+                    "name": "Minimal Provider",
+                    "base_url": "https://api.minimal.com/v1",
+                    "api_key_env": "MINIMAL_KEY",
+                    "models": {"model1": {"name": "Model 1"}},
+                }
+            }
+        }
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            f.flush()
+
+            with patch.dict(os.environ, {"PPXAI_CONFIG_FILE": f.name}):
+                with patch('ppxai.config._load_json_config', wraps=_load_json_config) as mock_load:
+                    first = load_config()
+                    second = load_config()
+                    assert first is second
+                    assert mock_load.call_count == 1
+
+                    reload_config()
+                    assert mock_load.call_count == 2
+
+        os.unlink(f.name)
+        reload_config()
+
     def test_json_config_with_missing_optional_fields(self):
         """Test JSON config handles missing optional fields gracefully."""
         config_data = {
@@ -0,0 +1,118 @@
+"""Unit tests for the ppxai.engine.client tool loop."""
+import asyncio
+
+import pytest
+
+from ppxai.engine.client import EngineClient
+from ppxai.engine.types import Event, EventType, ProviderCapabilities
+
+
+class FakeProvider:
+    """Provider that replays canned replies, streamed in small chunks."""
+
+    def __init__(self, replies, chunk_size=4):
+        self.replies = list(replies)
+        self.chunk_size = chunk_size
+        self.capabilities = ProviderCapabilities()
+        self.stream_flags = []
+
+    async def chat(self, messages, model, stream=False):
+        self.stream_flags.append(stream)
+        reply = self.replies.pop(0)
+        yield Event(EventType.STREAM_START, {"model": model})
+        if stream:
+            for i in range(0, len(reply), self.chunk_size):
+                yield Event(EventType.STREAM_CHUNK, reply[i:i + self.chunk_size])
+        yield Event(EventType.STREAM_END, reply)
+
+
+@pytest.fixture
+def engine():
+    """Create an engine with builtin tools enabled."""
+    client = EngineClient()
+    client.enable_tools()
+    client.model = "test-model"
+    return client
+
+
+def _run(engine, replies, stream=True, chunk_size=4):
+    engine.provider = FakeProvider(replies, chunk_size)
+
+    async def collect():
+        return [event async for event in engine._chat_with_tools(stream)]
+
+    return asyncio.run(collect())
+
+
+def _streamed_text(events):
+    return "".join(e.data for e in events if e.type == EventType.STREAM_CHUNK)
+
+
+class TestChatWithTools:
+    """Tests for tool-call detection while streaming."""
+
+    def test_prose_is_streamed_in_one_request(self, engine):
+        """Test that a plain answer is passed through from a single request."""
+        events = _run(engine, ["Hello there, this is prose."])
+        assert engine.provider.stream_flags == [True]
+        assert _streamed_text(events) == "Hello there, this is prose."
+        assert events[-1].type == EventType.STREAM_END
+
+    def test_leading_tool_call_is_not_streamed(self, engine):
+        """Test that a reply that is only a tool call never reaches the client as text."""
+        events = _run(engine, [
+            '{"tool": "calculator", "arguments": {"expression": "2+2"}}',
+            "The answer is 4.",
+        ])
+        types = [e.type for e in events]
+        assert EventType.TOOL_CALL in types
+        assert EventType.TOOL_RESULT in types
+        assert _streamed_text(events) == "The answer is 4."
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4, 64])
+    def test_tool_call_after_prose_is_not_streamed(self, engine, chunk_size):
+        """Test that a tool call following prose is held back and executed."""
+        events = _run(engine, [
+            'Let me compute that. {"tool": "calculator", "arguments": {"expression": "2+2"}}',
+            "The answer is 4.",
+        ], chunk_size=chunk_size)
+        text = _streamed_text(events)
+        assert '"tool"' not in text
+        assert text == "Let me compute that. The answer is 4."
+        results = [e.data for e in events if e.type == EventType.TOOL_RESULT]
+        assert results == [{"tool": "calculator", "result": "4"}]
+
+    def test_fenced_tool_call_after_prose_is_not_streamed(self, engine):
+        """Test that a tool call in a json code fence after prose is held back."""
+        events = _run(engine, [
+            'Checking.\n```json\n{"tool": "calculator", "arguments": {"expression": "3*3"}}\n```',
+            "It is 9.",
+        ])
+        text = _streamed_text(events)
+        assert "```" not in text
+        assert text == "Checking.\nIt is 9."
+
+    def test_non_tool_code_is_released(self, engine):
+        """Test that held-back text that is not a tool call is still delivered."""
+        reply = 'Use this:\n```json\n{"name": "x"}\n```\nand {braces} too.'
+        events = _run(engine, [reply])
+        assert _streamed_text(events) == reply
+        assert EventType.TOOL_CALL not in [e.type for e in events]
+
+
+class TestChatSync:
+    """Tests for the synchronous chat wrapper."""
+
+    def test_close_shuts_down_chat_loop(self, engine):
+        """Test that close() runs cleanup on the chat_sync() loop and closes it."""
+        engine.disable_tools()
+        engine.provider = FakeProvider(["first", "second"])
+        assert engine.chat_sync("hi") == "first"
+        assert engine.chat_sync("again") == "second"
+
+        runner = engine._runner
+        engine.close()
+        assert engine._runner is None
+        if runner is not None:
+            with pytest.raises(RuntimeError):
+                runner.get_loop()
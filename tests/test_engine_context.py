@@ -0,0 +1,36 @@
+"""Unit tests for ppxai.engine.context module."""
+import pytest
+
+from ppxai.engine.context import ContextInjector
+
+
+@pytest.fixture
+def injector():
+    """Create a context injector."""
+    return ContextInjector()
+
+
+class TestDetectFileReferences:
+    """Tests for file reference detection."""
+
+    def test_relative_and_absolute_paths(self, injector):
+        """Test that bare paths are found in mention order."""
+        refs = injector.detect_file_references("look at /a/b.py and ./c.txt or ~/d.md")
+        assert refs == ["/a/b.py", "./c.txt", "~/d.md"]
+
+    def test_quoted_path_with_spaces(self, injector):
+        """Test that quoted file names may contain spaces."""
+        assert injector.detect_file_references("open 'my notes.md' please") == ["my notes.md"]
+
+    def test_path_inside_quotes_is_found(self, injector):
+        """Test that a bare path inside a quoted span is still detected."""
+        refs = injector.detect_file_references('review "see ./x.py"')
+        assert "./x.py" in refs
+
+    def test_duplicates_are_removed(self, injector):
+        """Test that a file mentioned twice is reported once."""
+        assert injector.detect_file_references('./x.py and "./x.py"') == ["./x.py"]
+
+    def test_no_dot_means_no_references(self, injector):
+        """Test that messages without an extension yield nothing."""
+        assert injector.detect_file_references("hello world") == []
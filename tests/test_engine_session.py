@@ -0,0 +1,134 @@
+"""Unit tests for ppxai.engine.session module."""
+import pytest
+
+from ppxai.engine.session import SessionManager
+from ppxai.engine.types import Message
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a session manager writing to a temporary directory."""
+    return SessionManager(tmp_path / "sessions", tmp_path / "exports")
+
+
+def _fresh(manager):
+    """A second manager on the same directories, as after a restart."""
+    return SessionManager(manager.sessions_dir, manager.exports_dir)
+
+
+def _contents(manager):
+    return [m.content for m in manager.messages]
+
+
+def _counts(manager):
+    return {info.name: info.message_count for info in manager.list_sessions()}
+
+
+class TestSessionAppendLog:
+    """Tests for the per-session append log."""
+
+    def test_unsaved_session_writes_nothing(self, manager):
+        """Test that messages of a never-saved session stay in memory."""
+        manager.add_message(Message("user", "hello"))
+        manager.close()
+        assert list(manager.sessions_dir.iterdir()) == []
+
+    def test_messages_after_save_survive_reload(self, manager):
+        """Test that messages added after save() are replayed by load()."""
+        manager.add_message(Message("user", "one"))
+        manager.save("a")
+        manager.add_message(Message("assistant", "two", {"tool_call": {"tool": "x"}}))
+        manager.add_message(Message("user", "three"))
+        manager.close()
+
+        other = _fresh(manager)
+        assert other.load("a")
+        assert _contents(other) == ["one", "two", "three"]
+        assert other.messages[1].metadata == {"tool_call": {"tool": "x"}}
+        assert other.metadata["message_count"] == 3
+
+    def test_save_folds_log_into_session_file(self, manager):
+        """Test that save() empties the log so nothing replays twice."""
+        manager.save("a")
+        manager.add_message(Message("user", "one"))
+        manager.save()
+        assert (manager.sessions_dir / "a.jsonl").stat().st_size == 0
+
+        other = _fresh(manager)
+        other.load("a")
+        assert _contents(other) == ["one"]
+
+    def test_list_sessions_counts_logged_messages(self, manager):
+        """Test that list_sessions() agrees with load() on message counts."""
+        manager.add_message(Message("user", "one"))
+        manager.save("a")
+        assert _counts(manager) == {"a": 1}
+
+        manager.add_message(Message("assistant", "two"))
+        manager.add_message(Message("user", "three"))
+        assert _counts(manager) == {"a": 3}
+
+        manager.save()
+        assert _counts(manager) == {"a": 3}
+
+    def test_save_as_keeps_original_log(self, manager):
+        """Test that saving under a new name keeps what was logged to the old session."""
+        manager.add_message(Message("user", "one"))
+        manager.save("a")
+        manager.close()
+
+        other = _fresh(manager)
+        other.load("a")
+        other.add_message(Message("assistant", "two"))
+        other.save("b")
+        other.add_message(Message("user", "three"))
+        other.close()
+
+        check = _fresh(manager)
+        check.load("a")
+        assert _contents(check) == ["one", "two"]
+        check.load("b")
+        assert _contents(check) == ["one", "two", "three"]
+        assert _counts(check) == {"a": 2, "b": 3}
+
+    def test_clear_stops_logging(self, manager):
+        """Test that messages added after clear() are not appended to the saved session."""
+        manager.add_message(Message("user", "one"))
+        manager.save("a")
+        manager.clear()
+        manager.add_message(Message("user", "other"))
+        manager.close()
+
+        other = _fresh(manager)
+        other.load("a")
+        assert _contents(other) == ["one"]
+
+    def test_torn_log_line_is_ignored(self, manager):
+        """Test that a partially written last line is dropped on load."""
+        manager.save("a")
+        manager.add_message(Message("user", "one"))
+        manager.close()
+        with open(manager.sessions_dir / "a.jsonl", "ab") as f:
+            f.write(b'{"role": "user", "cont')
+
+        other = _fresh(manager)
+        other.load("a")
+        assert _contents(other) == ["one"]
+
+    def test_delete_session_removes_log(self, manager):
+        """Test that delete_session() removes the session file and its log."""
+        manager.save("a")
+        manager.add_message(Message("user", "one"))
+        assert manager.delete_session("a")
+        assert list(manager.sessions_dir.glob("a.*")) == []
+        assert manager.list_sessions() == []
+
+
+class TestSessionMessages:
+    """Tests for message access."""
+
+    def test_messages_as_dicts_are_copies(self, manager):
+        """Test that mutating returned dicts does not change the session."""
+        manager.add_message(Message("user", "hello"))
+        manager.get_messages_as_dicts()[0]["content"] = "changed"
+        assert manager.get_messages_as_dicts() == [{"role": "user", "content": "hello"}]
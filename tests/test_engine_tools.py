@@ -0,0 +1,106 @@
+"""Unit tests for the ppxai.engine tools and builtin tools."""
+import pytest
+
+from ppxai.engine.tools.base import BaseTool, FunctionTool
+from ppxai.engine.tools.builtin.calculator import calculate, _compile
+
+
+class TestCalculator:
+    """Tests for the calculator tool."""
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("2 + 2", "4"),
+        ("(123 + 456) * 2", "1158"),
+        ("1.5 * 4", "6.0"),
+        ("7 / 2", "3.5"),
+        ("7 // 2", "3"),
+        ("2 ** 10", "1024"),
+        ("-3 + +5", "2"),
+        ("-(2 * 3)", "-6"),
+        ("  42", "42"),
+    ])
+    def test_accepts_arithmetic(self, expression, expected):
+        """Test that plain arithmetic on numbers is evaluated."""
+        assert calculate(expression) == expected
+
+    def test_modulo_is_rejected_by_character_filter(self):
+        """Test that '%' is outside the allowed characters."""
+        assert calculate("7 % 3").startswith("Error: Invalid characters")
+
+    @pytest.mark.parametrize("expression", [
+        "__import__('os')",
+        "abs(-1)",
+        "(1).real",
+        "'a' * 3",
+        "x + 1",
+    ])
+    def test_rejects_non_numeric_input(self, expression):
+        """Test that names, calls, attributes and strings never evaluate."""
+        assert calculate(expression).startswith("Error")
+
+    @pytest.mark.parametrize("expression", [
+        "()",
+        "(1, 2)",
+        "[1]",
+        "1 < 2",
+        "1 if 1 else 2",
+        "lambda: 1",
+        "'a'",
+        "abs(1)",
+        "(1).real",
+    ])
+    def test_ast_whitelist_rejects_other_syntax(self, expression):
+        """Test that the AST check rejects anything but numeric arithmetic."""
+        with pytest.raises((ValueError, SyntaxError)):
+            _compile(expression)
+
+    def test_ast_whitelist_accepts_modulo(self):
+        """Test that the AST check itself allows '%'."""
+        assert eval(_compile("7 % 3"), {"__builtins__": {}}, {}) == 1
+
+    def test_division_by_zero(self):
+        """Test that runtime errors are reported, not raised."""
+        assert calculate("1 / 0") == "Error calculating: division by zero"
+
+
+class TestToolAvailability:
+    """Tests for provider filtering of tools."""
+
+    class _Tool(BaseTool):
+        name = "probe"
+
+        async def execute(self, **kwargs) -> str:
+            return ""
+
+    def test_class_level_filter(self):
+        """Test filters declared on the class."""
+        class OnlyA(self._Tool):
+            provider_specific = ["a"]
+
+        tool = OnlyA()
+        assert tool.is_available_for("a")
+        assert not tool.is_available_for("b")
+
+    def test_filter_set_in_init(self):
+        """Test filters assigned per instance in __init__."""
+        class Excluding(self._Tool):
+            def __init__(self, excluded):
+                self.provider_excluded = excluded
+
+        tool = Excluding(["a"])
+        assert not tool.is_available_for("a")
+        assert tool.is_available_for("b")
+
+    def test_filter_reassigned_later(self):
+        """Test that changing a filter after first use takes effect."""
+        tool = FunctionTool("probe", "", {}, lambda: "", provider_specific=["a"])
+        assert not tool.is_available_for("b")
+        tool.provider_specific = ["b"]
+        assert tool.is_available_for("b")
+        tool.provider_specific = None
+        assert tool.is_available_for("c")
+
+    def test_empty_filter_matches_no_provider(self):
+        """Test that an empty provider_specific list is not treated as unset."""
+        tool = FunctionTool("probe", "", {}, lambda: "", provider_specific=[])
+        assert not tool.is_available_for("a")